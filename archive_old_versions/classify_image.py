@@ -18,14 +18,15 @@ def main():
     args = p.parse_args()
 
     try:
-        model, classes = load_wbc_model(args.model)
+        model, classes, needs_softmax = load_wbc_model(args.model)
     except Exception as e:
         print(f"Error loading model: {e}")
         sys.exit(2)
     for img_name in os.listdir(args.image_folder):
         img_path = os.path.join(args.image_folder, img_name)
         try:
-            results = predict_image(model, classes, img_path, top_k=args.top)
+            results = predict_image(model, classes, img_path, top_k=args.top,
+                                    needs_softmax=needs_softmax)
         except Exception as e:
             print(f"Error during prediction: {e}")
             sys.exit(3)
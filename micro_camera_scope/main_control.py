@@ -2,8 +2,9 @@
 import cv2 #All computer vision
 import numpy as np #All arrays and alignment
 import threading #Collection of frames to stitch
+import concurrent.futures
 import time
-from queue import Queue
+from queue import Queue, Empty, Full
 import tkinter as tk #for UI
 from tkinter import ttk
 from tkinter import messagebox
@@ -14,6 +15,50 @@ import serial.tools.list_ports
 import json
 from visual_servo_tracker import VisualServoTracker
 
+# Numba is an optional accelerator - without it the jitted kernels below
+# simply run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Motor command codes used by the jitted kernels (numba works on ints,
+# call sites map codes back to the serial protocol characters)
+_CMD_CODES = ('S', 'U', 'D', 'L', 'R')
+
+
+@njit(cache=True, fastmath=True)
+def _nearest_centroid(centroids, target_x, target_y):
+    """Index and squared distance of the centroid nearest to the target."""
+    best_idx = -1
+    best_dist_sq = 1e18
+    for i in range(centroids.shape[0]):
+        dx = centroids[i, 0] - target_x
+        dy = centroids[i, 1] - target_y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq < best_dist_sq:
+            best_dist_sq = dist_sq
+            best_idx = i
+    return best_idx, best_dist_sq
+
+
+@njit(cache=True)
+def _motor_direction(error_x, error_y, deadzone, axis_threshold):
+    """Deadzone/threshold steering logic as command codes (see _CMD_CODES)."""
+    y_code = 0
+    x_code = 0
+    if abs(error_x) < deadzone and abs(error_y) < deadzone:
+        return y_code, x_code
+    if abs(error_y) > axis_threshold:
+        y_code = 2 if error_y > 0 else 1
+    if abs(error_x) > axis_threshold:
+        x_code = 4 if error_x > 0 else 3
+    return y_code, x_code
+
+
 class MicroscopeStitcher:
     """
     Main class for microscope image stitching with Arduino control.
@@ -65,6 +110,10 @@ class MicroscopeStitcher:
         self.frame_queue = Queue(maxsize=10)  # For cropped frames (small tile view)
         self.raw_frame_queue = Queue(maxsize=10)  # For raw frames (full window view)
         self.stitch_queue = Queue(maxsize=5)
+        # Single worker for slow disk writes (stitched PNG saves) so the GUI
+        # thread never blocks on encoding
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='io')
         
         # Visual servoing tracker integration
         self.visual_servo_tracker = VisualServoTracker(motor_controller=self)
@@ -78,6 +127,12 @@ class MicroscopeStitcher:
         # Arduino communication
         self.arduino = None
         self.arduino_connected = False
+        # Async serial worker - tracking code queues motor commands here so
+        # serial write/read latency never stalls the tracking loop
+        self._serial_command_queue = Queue(maxsize=1)
+        self._serial_worker_thread = threading.Thread(target=self._serial_worker)
+        self._serial_worker_thread.daemon = True
+        self._serial_worker_thread.start()
         self.set = False
         self.step_delay = 4000      # Microseconds between steps (speed)
         self.steps_per_move = 100   # Steps per button press
@@ -94,6 +149,7 @@ class MicroscopeStitcher:
         # GUI components
         self.root = None
         self.preview_window = None
+        self._preview_photo = None  # Reused Tk photo handle for the preview
         # Allow tests or headless environments to skip creating a Tk root
         if create_gui:
             self.setup_gui()
@@ -918,6 +974,9 @@ class MicroscopeStitcher:
             self.camera.set(cv2.CAP_PROP_FPS, 30)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            # Keep the driver-side buffer minimal so reads always return the
+            # newest frame instead of a stale backlog
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
             if not self.camera.isOpened():
                 raise Exception("Could not open camera")
@@ -955,22 +1014,34 @@ class MicroscopeStitcher:
         while self.is_capturing:
             ret, frame = self.camera.read()
             if ret:
-                # Add raw frame to raw queue for full window view
-                if not self.raw_frame_queue.full():
-                    self.raw_frame_queue.put(frame.copy())
-                
+                # Latest-wins policy: if a consumer has fallen behind, drop
+                # the oldest queued frame so the queues never hold a backlog
+                # that grows tracking/display latency
+                self._put_latest(self.raw_frame_queue, frame.copy())
+
                 # Crop frame for small tile view and stitching
                 frame_cropped = frame[self.crop_top:self.crop_bottom, self.crop_left:self.crop_right]
 
-                # Add cropped frame to queue for small tile display
-                if not self.frame_queue.full():
-                    self.frame_queue.put(frame_cropped.copy())
-                
+                self._put_latest(self.frame_queue, frame_cropped.copy())
+
                 # If stitching is active, add cropped frame to stitch queue
                 if self.stitching_active and not self.stitch_queue.full():
                     self.stitch_queue.put(frame_cropped.copy())
-            
+
             time.sleep(1/30)  # 30 FPS
+
+    @staticmethod
+    def _put_latest(queue, frame):
+        """Put frame on queue, evicting the oldest entry if the queue is full."""
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except Empty:
+                pass
+        try:
+            queue.put_nowait(frame)
+        except Full:
+            pass
     
     def update_display(self):
         """Update camera display in GUI - handles both small tile and full window views"""
@@ -1378,6 +1449,7 @@ class MicroscopeStitcher:
         
         self.preview_label = ttk.Label(self.preview_window, text="Stitched image preview")
         self.preview_label.pack(expand=True, fill='both')
+        self._preview_photo = None  # Force fresh photo for the new window
     
     def update_preview(self):
         """Update the preview window with current stitched result"""
@@ -1403,13 +1475,23 @@ class MicroscopeStitcher:
                     new_h = int(h * scale)
                     preview_img = cv2.resize(preview_img, (new_w, new_h))
                 
-                # Convert and display
-                preview_rgb = cv2.cvtColor(preview_img, cv2.COLOR_BGR2RGB)
+                # Convert and display - reuse one Tk photo handle and paste
+                # into it in place; allocating a fresh ImageTk.PhotoImage per
+                # tick churns Tk photo resources. Re-create only when the
+                # preview size changes (the stitched region grows over time).
+                # Reversed-channel view + one contiguous copy is cheaper than
+                # cvtColor at preview sizes (<= 700 px)
+                preview_rgb = np.ascontiguousarray(preview_img[..., ::-1])
                 image = Image.fromarray(preview_rgb)
-                photo = ImageTk.PhotoImage(image)
-                
-                self.preview_label.config(image=photo, text="")
-                self.preview_label.image = photo
+
+                if (self._preview_photo is None or
+                        self._preview_photo.width() != image.width or
+                        self._preview_photo.height() != image.height):
+                    self._preview_photo = ImageTk.PhotoImage(image)
+                    self.preview_label.config(image=self._preview_photo, text="")
+                    self.preview_label.image = self._preview_photo
+                else:
+                    self._preview_photo.paste(image)
                 
             except Exception as e:
                 print(f"Preview update error: {e}")
@@ -1458,8 +1540,28 @@ class MicroscopeStitcher:
             
             timestamp = int(time.time())
             filename = f"stitched_microscope_{timestamp}.png"
-            cv2.imwrite(filename, result_img)
-            self.status_var.set(f"Saved: {filename}")
+
+            # Write the PNG off the GUI thread - copy first because the
+            # stitching thread may keep mutating the canvas while zlib runs
+            img_to_save = result_img.copy()
+
+            def _on_save_done(future):
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    ok = False
+                    print(f"Save failed: {e}")
+                msg = f"Saved: {filename}" if ok else f"Save failed: {filename}"
+                if self.root:
+                    self.root.after(0, lambda: self.status_var.set(msg))
+                else:
+                    self.status_var.set(msg)
+
+            save_future = self._io_executor.submit(
+                cv2.imwrite, filename, img_to_save,
+                [cv2.IMWRITE_PNG_COMPRESSION, 3])
+            save_future.add_done_callback(_on_save_done)
+            self.status_var.set(f"Saving {filename} in background...")
     
     # ============================================================
     # VISUAL SERVOING METHODS
@@ -1495,6 +1597,19 @@ class MicroscopeStitcher:
         self.MIN_CONTOUR_AREA = 50
         self.MAX_CONTOUR_AREA = 3000
         self.SEARCH_RADIUS = 150
+        self.CLICK_SELECT_RADIUS = 100
+        self.MIN_FG_PIXELS = 50  # Below this many FG pixels the frame is "quiet"
+
+        # Squared thresholds - find_nearest_contour returns squared distances
+        self._MAX_JUMP_DISTANCE_SQ = self.MAX_JUMP_DISTANCE ** 2
+        self._CLICK_SELECT_RADIUS_SQ = self.CLICK_SELECT_RADIUS ** 2
+
+        # Mask pipeline resources - kernel built once, and the backsub/morph
+        # chain runs on UMat (OpenCL) when the platform supports it
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            print("OpenCL available - mask pipeline will run on UMat")
         
         # Motor control parameters (updated for much calmer movement)
         self.auto_centering_enabled = False
@@ -1548,19 +1663,42 @@ class MicroscopeStitcher:
                         self.frame_center_y = frame.shape[0] // 2
                         print(f"Frame center: ({self.frame_center_x}, {self.frame_center_y})")
                     
-                    # Background subtraction
-                    fg_mask = self.backsub.apply(frame)
-                    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-                    mask_cleaned = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
-                    
-                    # Find contours
-                    contours, _ = cv2.findContours(mask_cleaned, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                    valid_contours = [c for c in contours if self.MIN_CONTOUR_AREA < cv2.contourArea(c) < self.MAX_CONTOUR_AREA]
-                    
-                    # Handle click selection
-                    if self.awaiting_selection and self.click_position:
-                        nearest_cnt, distance, centroid = self.find_nearest_contour(valid_contours, self.click_position)
-                        if nearest_cnt is not None and distance < 100:
+                    # Background subtraction - offloaded to OpenCL via UMat
+                    # when available (findContours needs a CPU ndarray, so
+                    # the cleaned mask is pulled back down at the end)
+                    if self._use_opencl:
+                        fg_mask = self.backsub.apply(cv2.UMat(frame))
+                    else:
+                        fg_mask = self.backsub.apply(frame)
+
+                    # Quiet-frame fast path - one cheap reduction decides
+                    # whether morphology + contour extraction are worth
+                    # running; below threshold the previous tracking state is
+                    # simply redrawn
+                    motion_detected = cv2.countNonZero(fg_mask) >= self.MIN_FG_PIXELS
+
+                    if motion_detected:
+                        mask_cleaned = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self._morph_kernel)
+                        if self._use_opencl:
+                            mask_cleaned = mask_cleaned.get()
+
+                        # Find contours - cheap point-count prefilter rejects
+                        # most noise blobs before paying for cv2.contourArea
+                        # (with CHAIN_APPROX_SIMPLE, valid blobs have few
+                        # points)
+                        contours, _ = cv2.findContours(mask_cleaned, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+                        valid_contours = [c for c in contours
+                                          if 4 <= len(c) <= 200
+                                          and self.MIN_CONTOUR_AREA < cv2.contourArea(c) < self.MAX_CONTOUR_AREA]
+                    else:
+                        mask_cleaned = fg_mask.get() if self._use_opencl else fg_mask
+                        valid_contours = []
+
+                    # Handle click selection (only on frames with motion, so
+                    # a click is not consumed while the scene is quiet)
+                    if motion_detected and self.awaiting_selection and self.click_position:
+                        nearest_cnt, distance_sq, centroid = self.find_nearest_contour(valid_contours, self.click_position)
+                        if nearest_cnt is not None and distance_sq < self._CLICK_SELECT_RADIUS_SQ:
                             self.tracking_active = True
                             self.target_position = centroid
                             self.selected_contour = nearest_cnt
@@ -1572,10 +1710,10 @@ class MicroscopeStitcher:
                         self.awaiting_selection = False
                         self.click_position = None
                     
-                    # Update tracking
-                    if self.tracking_active and self.target_position:
-                        nearest_cnt, distance, centroid = self.find_nearest_contour(valid_contours, self.target_position)
-                        if nearest_cnt is not None and distance < self.MAX_JUMP_DISTANCE:
+                    # Update tracking (quiet frames keep the previous state)
+                    if motion_detected and self.tracking_active and self.target_position:
+                        nearest_cnt, distance_sq, centroid = self.find_nearest_contour(valid_contours, self.target_position)
+                        if nearest_cnt is not None and distance_sq < self._MAX_JUMP_DISTANCE_SQ:
                             self.target_position = centroid
                             self.target_history.append(centroid)
                             self.selected_contour = nearest_cnt
@@ -1625,14 +1763,12 @@ class MicroscopeStitcher:
                                 (255, 0, 0), 2)
                         
                     
-                    # Draw all contours faintly
+                    # Draw all contours faintly (bounding-rect center is
+                    # plenty accurate for a 3 px marker)
                     for cnt in valid_contours:
-                        M = cv2.moments(cnt)
-                        if M["m00"] != 0:
-                            cx = int(M["m10"] / M["m00"])
-                            cy = int(M["m01"] / M["m00"])
-                            cv2.drawContours(display_frame, [cnt], -1, (255, 200, 100), 1)
-                            cv2.circle(display_frame, (cx, cy), 3, (255, 200, 100), -1)
+                        x, y, w, h = cv2.boundingRect(cnt)
+                        cv2.drawContours(display_frame, [cnt], -1, (255, 200, 100), 1)
+                        cv2.circle(display_frame, (x + w // 2, y + h // 2), 3, (255, 200, 100), -1)
                     
                     # Draw tracking info
                     if self.tracking_active and self.target_position:
@@ -1659,10 +1795,10 @@ class MicroscopeStitcher:
                             points = np.array(self.target_history, dtype=np.int32)
                             cv2.polylines(display_frame, [points], False, (0, 255, 255), 2)
                     
-                    # Status overlay
-                    status_bg = display_frame.copy()
-                    cv2.rectangle(status_bg, (0, 0), (display_frame.shape[1], 80), (0, 0, 0), -1)
-                    cv2.addWeighted(status_bg, 0.4, display_frame, 0.6, 0, display_frame)
+                    # Status overlay - darken only the top bar in place instead of
+                    # copying and alpha-blending the whole frame
+                    status_bar = display_frame[:80]
+                    np.multiply(status_bar, 0.6, out=status_bar, casting='unsafe')
                     
                     # Status text
                     if self.tracking_active:
@@ -1698,9 +1834,13 @@ class MicroscopeStitcher:
                         print("Tracking reset - Motors stopped")
                     elif key == ord('t'):
                         self.toggle_auto_tracking()
-                
-                time.sleep(1/30)
-                
+                else:
+                    # No frame ready - brief sleep only on idle iterations.
+                    # cv2.waitKey(1) above already yields to the GUI whenever
+                    # a frame was processed, so a fixed 33 ms tick on top of
+                    # it just throttled the loop below camera rate.
+                    time.sleep(0.005)
+
             except Exception as e:
                 print(f"Tracking error: {e}")
                 time.sleep(0.1)
@@ -1717,30 +1857,30 @@ class MicroscopeStitcher:
             print(f"Click at ({x}, {y})")
     
     def find_nearest_contour(self, contours, target_point):
-        """Find contour closest to target point."""
+        """Find contour closest to target point.
+
+        Returns (contour, squared_distance, centroid). Squared distances avoid
+        a sqrt per contour per frame - callers compare against the squared
+        thresholds set up in start_organism_tracking.
+        """
         if not contours:
             return None, float('inf'), None
-        
-        min_distance = float('inf')
-        nearest_contour = None
-        nearest_centroid = None
-        
-        for cnt in contours:
-            M = cv2.moments(cnt)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            distance = np.sqrt((cx - target_point[0])**2 + (cy - target_point[1])**2)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_contour = cnt
-                nearest_centroid = (cx, cy)
-        
-        return nearest_contour, min_distance, nearest_centroid
+
+        # Gather centroids into a float32 array so the nearest-neighbor scan
+        # runs in the jitted kernel instead of Python-level comparisons.
+        # Bounding-rect centers are O(perimeter) vs O(area) for cv2.moments
+        # and are accurate enough for nearest-neighbor matching.
+        centroids = np.empty((len(contours), 2), dtype=np.float32)
+        for i, cnt in enumerate(contours):
+            x, y, w, h = cv2.boundingRect(cnt)
+            centroids[i, 0] = x + w // 2
+            centroids[i, 1] = y + h // 2
+
+        idx, distance_sq = _nearest_centroid(
+            centroids, float(target_point[0]), float(target_point[1]))
+
+        centroid = (int(centroids[idx, 0]), int(centroids[idx, 1]))
+        return contours[idx], distance_sq, centroid
     
     def compute_motor_direction(self, cx, cy):
         """
@@ -1749,56 +1889,57 @@ class MicroscopeStitcher:
         """
         if self.frame_center_x is None or self.frame_center_y is None:
             return 'S', 'S'  # Stop if no center defined
-        
-        # Compute pixel error (organism position - frame center)
-        error_x = cx - self.frame_center_x
-        error_y = cy - self.frame_center_y
-        
-        # Global deadzone - if both errors are small, don't move at all
-        if abs(error_x) < self.DEADZONE and abs(error_y) < self.DEADZONE:
-            return 'S', 'S'  # Stop - organism is centered enough
-        
-        # Independent axis movement with higher thresholds
-        y_cmd = 'S'  # Default to stop
-        x_cmd = 'S'  # Default to stop
-        
-        # Only move Y if error is significant (prevents small jitter movements)
-        if abs(error_y) > self.AXIS_THRESHOLD:
-            if error_y > 0:
-                y_cmd = 'D'  # Organism too high, move stage down
-            else:
-                y_cmd = 'U'  # Organism too low, move stage up
-        
-        # Only move X if error is significant (prevents small jitter movements)
-        if abs(error_x) > self.AXIS_THRESHOLD:
-            if error_x > 0:
-                x_cmd = 'R'  # Organism too right, move stage left
-            else:
-                x_cmd = 'L'  # Organism too left, move stage right
-        
-        return y_cmd, x_cmd
+
+        # Deadzone and per-axis threshold logic lives in the jitted
+        # _motor_direction kernel; map its codes back to protocol chars
+        y_code, x_code = _motor_direction(
+            cx - self.frame_center_x, cy - self.frame_center_y,
+            self.DEADZONE, self.AXIS_THRESHOLD)
+        return _CMD_CODES[y_code], _CMD_CODES[x_code]
     
-    def send_motor_command_simple(self, y_cmd, x_cmd, cx=None, cy=None):
+    def _serial_worker(self):
         """
-        Send single motor command for tracking (3 second intervals, thread-safe).
+        Dedicated serial thread - drains queued motor commands onto the port.
+
+        Owning the write/sleep/readline sequence here means the tracking loop
+        never blocks on serial I/O. Runs as a daemon for the app's lifetime.
         """
-        # Don't send if no movement needed
-        if y_cmd == 'S' and x_cmd == 'S':
-            # Always allow stop commands to go through immediately
+        while True:
+            cmd_bytes = self._serial_command_queue.get()
             if not self.arduino_connected or not self.arduino:
-                return False
+                continue
             try:
-                cmd = f"{y_cmd}{x_cmd}\n"
-                self.arduino.write(cmd.encode())
+                self.arduino.write(cmd_bytes)
                 time.sleep(0.02)
                 if self.arduino.in_waiting:
                     self.arduino.readline()  # Consume response
-                print("Motors stopped")
-                return True
             except Exception as e:
-                print(f"Stop command failed: {e}")
+                print(f"Serial worker error: {e}")
+
+    def send_motor_command_simple(self, y_cmd, x_cmd, cx=None, cy=None):
+        """
+        Queue a motor command for tracking (3 second intervals, non-blocking).
+
+        Commands are handed to the serial worker thread, so this returns
+        immediately. Stop commands displace any queued movement command.
+        """
+        cmd_bytes = f"{y_cmd}{x_cmd}\n".encode()
+
+        # Stop commands always go through - pre-empt any queued movement
+        if y_cmd == 'S' and x_cmd == 'S':
+            if not self.arduino_connected or not self.arduino:
                 return False
-        
+            try:
+                self._serial_command_queue.get_nowait()
+            except Empty:
+                pass
+            try:
+                self._serial_command_queue.put_nowait(cmd_bytes)
+            except Full:
+                pass
+            print("Motors stopped")
+            return True
+
         # Rate limiting - 3 seconds between movement commands
         current_time = time.time()
         time_since_last = current_time - self.last_motor_command_time
@@ -1808,37 +1949,27 @@ class MicroscopeStitcher:
             if int(remaining) % 2 == 0 and remaining > 1.0:  # Print every 2 seconds, only if >1s remaining
                 print(f"Motor ready in {remaining:.0f}s...")
             return True
-        
-        # Send command directly to Arduino without GUI updates
+
         if not self.arduino_connected or not self.arduino:
             print("Arduino not connected for motor command")
             return False
-        
+
         try:
-            cmd = f"{y_cmd}{x_cmd}\n"
-            self.arduino.write(cmd.encode())
-            
-            # Brief wait for Arduino processing
-            time.sleep(0.02)
-            
-            # Read response if available (optional)
-            if self.arduino.in_waiting:
-                response = self.arduino.readline().decode().strip()
-                # Don't print response to avoid spam, just consume it
-            
-            self.last_motor_command_time = current_time
-            # Show actual command with error context if position provided
-            if cx is not None and cy is not None and self.frame_center_x is not None:
-                error_x = cx - self.frame_center_x
-                error_y = cy - self.frame_center_y
-                print(f"MOTOR COMMAND: {y_cmd}{x_cmd} | Error: ({error_x:+d}, {error_y:+d}) | Next in 3.0s")
-            else:
-                print(f"MOTOR COMMAND: {y_cmd}{x_cmd} | Next in 3.0s")
+            self._serial_command_queue.put_nowait(cmd_bytes)
+        except Full:
+            # Worker still busy with the previous command - drop this one,
+            # the next tracking update will retry
             return True
-            
-        except Exception as e:
-            print(f"Motor command failed: {e}")
-            return False
+
+        self.last_motor_command_time = current_time
+        # Show actual command with error context if position provided
+        if cx is not None and cy is not None and self.frame_center_x is not None:
+            error_x = cx - self.frame_center_x
+            error_y = cy - self.frame_center_y
+            print(f"MOTOR COMMAND: {y_cmd}{x_cmd} | Error: ({error_x:+d}, {error_y:+d}) | Next in 3.0s")
+        else:
+            print(f"MOTOR COMMAND: {y_cmd}{x_cmd} | Next in 3.0s")
+        return True
     
     def stop_organism_tracking(self):
         """Stop organism tracking and reset button states (GUI thread safe)."""
@@ -1,37 +1,161 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
-from collections import deque
 
-class InteractiveOrganismTracker:
+# scipy is optional - with it, crowded frames use a KD-tree for the
+# nearest/radius queries instead of a linear centroid scan
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# numba is optional too: when present the centroid scan below compiles to
+# native code, otherwise the no-op decorator leaves plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _nearest_centroid_sq(centroids, target_x, target_y):
+    """
+    Scan a float32 (N, 2) centroid array for the entry nearest to the
+    target. Returns (index, squared distance). Branch-light argmin only -
+    the caller verifies the search radius afterwards (nearest-then-check
+    beats radius-filter-then-nearest since the tracked target rarely
+    leaves the radius between frames). Pure-array loop so numba can
+    compile it; cv2.moments stays on the OpenCV (C) side.
+    """
+    best_idx = 0
+    best_d2 = 1e18
+    for i in range(centroids.shape[0]):
+        dx = centroids[i, 0] - target_x
+        dy = centroids[i, 1] - target_y
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2 = d2
+            best_idx = i
+    return best_idx, best_d2
+
+
+def _contour_centroids(contours):
+    """
+    Compute centroids for a list of contours in one pass.
+
+    Returns (kept_contours, centroids) where centroids is a float32 (N, 2)
+    array aligned with kept_contours; contours with m00 == 0 are dropped.
+    Gathering the centroids into one array lets callers do distance math as
+    a single NumPy expression instead of per-contour Python arithmetic.
+    """
+    kept = []
+    cents = []
+    for cnt in contours:
+        M = cv2.moments(cnt)
+        if M["m00"] == 0:
+            continue
+        kept.append(cnt)
+        cents.append((int(M["m10"] / M["m00"]), int(M["m01"] / M["m00"])))
+    return kept, np.asarray(cents, dtype=np.float32).reshape(-1, 2)
+
+
+class _BaseTracker:
+    """
+    Shared capture/background-subtraction setup for the trackers below.
+
+    Owns the camera handle (negotiated to MJPEG with a single-frame
+    driver buffer), the MOG2 subtractor, the morphology kernel and the
+    reusable mask buffer, so capture-path tuning lands in every tracker
+    at once instead of drifting between them.
+    """
+
+    def __init__(self, camera_index=1):
+        # Video capture - negotiate MJPEG so the camera compresses on the
+        # wire and libjpeg handles decode, instead of raw YUYV eating USB
+        # bandwidth plus a software color conversion per frame.
+        # BUFFERSIZE=1 keeps the driver from queueing stale frames.
+        self.cap = cv2.VideoCapture(camera_index)
+        self.cap.set(cv2.CAP_PROP_FOURCC,
+                     cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Background subtractor
+        self.backsub = cv2.createBackgroundSubtractorMOG2(
+            history=500,
+            varThreshold=50,
+            detectShadows=True
+        )
+
+        # Constant morphology kernel plus a reusable mask buffer
+        # (lazy-allocated once the frame size is known)
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self.mask_cleaned = None
+
+
+class InteractiveOrganismTracker(_BaseTracker):
     """
     Click-to-track organism detector.
-    
+
     Concept:
     1. User clicks on organism
     2. System finds nearest contour to click
     3. Tracks that specific contour across frames
     4. Ignores all other motion (debris, noise, other organisms)
     """
-    
+
     def __init__(self):
-        # Video capture
-        self.cap = cv2.VideoCapture(1)
-        
-        # Background subtractor
-        self.backsub = cv2.createBackgroundSubtractorMOG2(
-            history=500, 
-            varThreshold=50, 
-            detectShadows=True
-        )
-        
+        super().__init__()
+
+        # Optional CUDA pipeline: on CUDA-capable builds, MOG2 + morphology
+        # run on the GPU via GpuMat with a persistent stream, leaving the
+        # CPU free for contour extraction. Detected once here; run() falls
+        # back to the CPU path when unavailable.
+        self.use_cuda = False
+        try:
+            self.use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            pass
+        if self.use_cuda:
+            self.gpu_frame = cv2.cuda_GpuMat()
+            self.gpu_mask = cv2.cuda_GpuMat()
+            self.gpu_backsub = cv2.cuda.createBackgroundSubtractorMOG2(
+                history=500, varThreshold=50, detectShadows=True)
+            self.gpu_morph = cv2.cuda.createMorphologyFilter(
+                cv2.MORPH_OPEN, cv2.CV_8UC1, self.kernel)
+            self.stream = cv2.cuda_Stream()
+            print("CUDA device detected - mask pipeline will run on GPU")
+
+        # Without CUDA, UMat gives transparent OpenCL offload of the same
+        # MOG2 + morphology chain on integrated GPUs - no API changes, the
+        # ops just run on the device until .get() pulls the mask back
+        self.use_opencl = not self.use_cuda and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            print("OpenCL available - mask pipeline will use UMat offload")
+
         # ============================================================
         # TRACKING STATE
         # ============================================================
         self.tracking_active = False
         self.target_position = None  # (x, y) of tracked organism
-        self.target_history = deque(maxlen=50)  # Trail of positions
+        # Trail of positions - fixed NumPy ring buffer instead of a deque,
+        # so rendering never converts the history to an array per frame
+        self.TRAIL_LENGTH = 50
+        # Stored in the (N, 1, 2) layout cv2.polylines expects, so the
+        # render path can pass a slice of this buffer with zero copies
+        self._trail = np.zeros((self.TRAIL_LENGTH, 1, 2), np.int32)
+        self._trail_head = 0
+        self._trail_count = 0
         self.selected_contour = None
-        
+
         # ============================================================
         # MOUSE INTERACTION
         # ============================================================
@@ -45,7 +169,22 @@ class InteractiveOrganismTracker:
         self.MIN_CONTOUR_AREA = 50
         self.MAX_CONTOUR_AREA = 3000
         self.SEARCH_RADIUS = 150  # Search radius around last known position
-        
+        # Squared thresholds - the hot path compares squared distances and
+        # never takes a square root (log prints use math.sqrt on demand)
+        self._MAX_JUMP_SQ = self.MAX_JUMP_DISTANCE ** 2
+        self._SEARCH_RADIUS_SQ = self.SEARCH_RADIUS ** 2
+        self._CLICK_TOL_SQ = 100 ** 2  # Max click-to-contour pickup distance
+        # Below this many contours a linear scan beats building a KD-tree
+        self.KDTREE_MIN_CONTOURS = 32
+        # Detection runs at half resolution (one pyrDown) - 4x fewer pixels
+        # through MOG2/morphology/findContours. Coordinates are scaled back
+        # up right after extraction so everything downstream stays in
+        # full-resolution pixel space; only the area filter needs the
+        # small-frame equivalents.
+        self.SCALE = 2
+        self._min_area_small = self.MIN_CONTOUR_AREA / (self.SCALE * self.SCALE)
+        self._max_area_small = self.MAX_CONTOUR_AREA / (self.SCALE * self.SCALE)
+
         # ============================================================
         # VISUALIZATION
         # ============================================================
@@ -55,6 +194,20 @@ class InteractiveOrganismTracker:
         
         # Performance
         self.frame_count = 0
+
+        # Capture runs on its own thread, writing the newest frame into a
+        # two-slot buffer (drop-oldest). The processing loop always reads
+        # the latest slot and skips iterations where nothing new arrived,
+        # so camera I/O overlaps with the mask/contour compute.
+        self._frame_lock = threading.Lock()
+        self._frame_slots = [None, None]
+        self._frame_seq = 0
+        self._capture_running = False
+
+        # Screenshot encoding happens off-thread so a ~50 ms PNG write
+        # never stalls the tracking loop
+        self._io_pool = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix='io')
         
         print("Interactive Organism Tracker Initialized")
         print("Click on an organism to start tracking!")
@@ -69,42 +222,73 @@ class InteractiveOrganismTracker:
             print(f"\n[CLICK] Position: ({x}, {y})")
             print("Searching for nearest contour...")
     
-    def find_nearest_contour(self, contours, target_point):
+    def _capture_loop(self):
+        """
+        Producer thread: keep the two-slot buffer topped up with the
+        newest frame. Writes go to the slot the consumer is not reading,
+        then the sequence counter is bumped to publish it.
+        """
+        while self._capture_running:
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            with self._frame_lock:
+                self._frame_slots[(self._frame_seq + 1) % 2] = frame
+                self._frame_seq += 1
+
+    def _latest_frame(self):
+        """Return (seq, frame) for the newest published frame."""
+        with self._frame_lock:
+            return self._frame_seq, self._frame_slots[self._frame_seq % 2]
+
+    def _extract_candidates(self, contours):
+        """
+        Fused single pass over raw contours: compute moments once, use m00 as
+        the area (equivalent to contourArea for filled binary blobs), apply
+        the area filter, and keep the centroid alongside each survivor.
+
+        Returns (valid_contours, centroids) with centroids float32 (N, 2),
+        so the selection/tracking/drawing steps never recompute moments.
+        """
+        kept = []
+        cents = []
+        for cnt in contours:
+            M = cv2.moments(cnt)
+            area = M["m00"]
+            if not (self._min_area_small < area < self._max_area_small):
+                continue
+            kept.append(cnt)
+            cents.append((int(M["m10"] / area), int(M["m01"] / area)))
+        return kept, np.asarray(cents, dtype=np.float32).reshape(-1, 2)
+
+    def find_nearest_contour(self, contours, target_point, centroids=None):
         """
         Find contour whose centroid is closest to target point.
-        
+
         Args:
             contours: List of contours
             target_point: (x, y) tuple
-            
+            centroids: Optional precomputed float32 (N, 2) centroid array
+                       aligned with contours (from _extract_candidates)
+
         Returns:
-            nearest_contour, distance, centroid
+            nearest_contour, squared distance, centroid
         """
-        if not contours:
+        if centroids is not None:
+            kept, cents = contours, centroids
+        else:
+            kept, cents = _contour_centroids(contours)
+        if not len(kept):
             return None, float('inf'), None
-        
-        min_distance = float('inf')
-        nearest_contour = None
-        nearest_centroid = None
-        
-        for cnt in contours:
-            # Calculate centroid
-            M = cv2.moments(cnt)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            # Distance to target
-            distance = np.sqrt((cx - target_point[0])**2 + (cy - target_point[1])**2)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_contour = cnt
-                nearest_centroid = (cx, cy)
-        
-        return nearest_contour, min_distance, nearest_centroid
+
+        # Squared distances to the target in one vectorized expression
+        dx = cents[:, 0] - target_point[0]
+        dy = cents[:, 1] - target_point[1]
+        d2 = dx * dx + dy * dy
+
+        idx = int(np.argmin(d2))
+        centroid = (int(cents[idx, 0]), int(cents[idx, 1]))
+        return kept[idx], float(d2[idx]), centroid
     
     def filter_contours_near_target(self, contours, target_position):
         """
@@ -114,71 +298,107 @@ class InteractiveOrganismTracker:
         """
         if target_position is None:
             return contours
-        
-        filtered = []
-        
-        for cnt in contours:
-            # Calculate centroid
-            M = cv2.moments(cnt)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            # Distance to last known position
-            distance = np.sqrt(
-                (cx - target_position[0])**2 + 
-                (cy - target_position[1])**2
-            )
-            
-            # Only keep contours within search radius
-            if distance <= self.SEARCH_RADIUS:
-                filtered.append(cnt)
-        
-        return filtered
+
+        kept, cents = _contour_centroids(contours)
+        if not kept:
+            return []
+
+        # Boolean radius mask on squared distances - one pass, no sqrt
+        dx = cents[:, 0] - target_position[0]
+        dy = cents[:, 1] - target_position[1]
+        d2 = dx * dx + dy * dy
+        within = np.nonzero(d2 <= self._SEARCH_RADIUS_SQ)[0]
+
+        return [kept[i] for i in within]
     
-    def update_tracking(self, contours):
+    def update_tracking(self, contours, centroids=None):
         """
         Update tracking by finding nearest contour to last known position.
-        
+
         KEY LOGIC:
-        1. Filter contours to search radius around last position
+        1. Restrict to contours within the search radius of last position
         2. Find nearest contour within that radius
         3. Update position
         4. If no contour found nearby → tracking lost
+
+        The radius filter and nearest-neighbor search are fused into one
+        vectorized pass over the (precomputed) centroid array.
         """
         if not self.tracking_active or self.target_position is None:
             return None
-        
-        # Filter to contours near last known position
-        nearby_contours = self.filter_contours_near_target(contours, self.target_position)
-        
-        if not nearby_contours:
-            # No contours nearby → organism might have left frame or stopped moving
-            return None
-        
-        # Find nearest contour to last position
-        nearest_cnt, distance, centroid = self.find_nearest_contour(
-            nearby_contours, 
-            self.target_position
-        )
-        
-        if nearest_cnt is None:
+
+        if centroids is None:
+            contours, centroids = _contour_centroids(contours)
+        if not len(contours):
             return None
-        
+
+        if cKDTree is not None and len(contours) >= self.KDTREE_MIN_CONTOURS:
+            # Crowded frame: O(log N) nearest query with the radius bound
+            # folded in (distance comes back as inf when nothing qualifies)
+            tree = cKDTree(centroids)
+            distance, idx = tree.query(self.target_position, k=1,
+                                       distance_upper_bound=self.SEARCH_RADIUS)
+            if not np.isfinite(distance):
+                return None
+            idx = int(idx)
+            distance_sq = float(distance) ** 2
+        else:
+            # Nearest first, verify radius after: one jitted argmin pass,
+            # and the radius check runs once instead of per candidate
+            idx, distance_sq = _nearest_centroid_sq(
+                centroids,
+                float(self.target_position[0]),
+                float(self.target_position[1]),
+            )
+            if distance_sq > self._SEARCH_RADIUS_SQ:
+                # No contours nearby → organism might have left frame or stopped moving
+                return None
+            idx = int(idx)
+            distance_sq = float(distance_sq)
+        centroid = (int(centroids[idx, 0]), int(centroids[idx, 1]))
+        nearest_cnt = contours[idx]
+
         # Check if jump is reasonable (organism can't teleport)
-        if distance > self.MAX_JUMP_DISTANCE:
-            print(f"[WARNING] Large jump detected: {distance:.1f}px - possible tracking loss")
+        if distance_sq > self._MAX_JUMP_SQ:
+            print(f"[WARNING] Large jump detected: {math.sqrt(distance_sq):.1f}px - possible tracking loss")
             # Could choose to stop tracking here, or continue with caution
             # return None  # Uncomment to stop tracking on large jumps
         
         # Update tracking state
         self.target_position = centroid
-        self.target_history.append(centroid)
+        self._trail_append(centroid)
         self.selected_contour = nearest_cnt
-        
+
         return nearest_cnt
+
+    # ============================================================
+    # TRAIL RING BUFFER
+    # ============================================================
+
+    def _trail_append(self, point):
+        """O(1) ring-buffer append - overwrites the oldest slot when full."""
+        self._trail[self._trail_head, 0] = point
+        self._trail_head = (self._trail_head + 1) % self.TRAIL_LENGTH
+        self._trail_count = min(self.TRAIL_LENGTH, self._trail_count + 1)
+
+    def _trail_clear(self):
+        """Reset the trail without reallocating the buffer."""
+        self._trail_head = 0
+        self._trail_count = 0
+
+    def _trail_polyline(self):
+        """
+        Trail oldest-to-newest in the (N, 1, 2) layout cv2.polylines takes.
+        Zero-copy slice until the ring wraps; after that a single np.roll
+        restores chronological order.
+        """
+        if self._trail_count < self.TRAIL_LENGTH:
+            return self._trail[:self._trail_count]
+        return np.roll(self._trail, -self._trail_head, axis=0)
+
+    def _trail_points(self):
+        """Trail positions oldest-to-newest as an int32 (N, 2) view."""
+        return self._trail_polyline()[:, 0]
     
     def draw_tracking_info(self, frame):
         """
@@ -208,35 +428,36 @@ class InteractiveOrganismTracker:
             cv2.circle(frame, (cx, cy), 8, (0, 0, 255), -1)
             cv2.circle(frame, (cx, cy), 12, (255, 255, 255), 2)
             
-            # Coordinates
-            cv2.putText(frame, f"TRACKING: ({cx}, {cy})", 
+            # Coordinates - one anti-aliased pass instead of the old
+            # outline + fill double rasterization
+            cv2.putText(frame, f"TRACKING: ({cx}, {cy})",
                        (cx + 15, cy - 15),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            cv2.putText(frame, f"TRACKING: ({cx}, {cy})", 
-                       (cx + 15, cy - 15),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1)
-            
-            # Trail of previous positions
-            if len(self.target_history) > 1:
-                points = np.array(self.target_history, dtype=np.int32)
-                cv2.polylines(frame, [points], False, self.trail_color, 2)
-                
-                # Draw dots along trail
-                for i, point in enumerate(self.target_history):
-                    alpha = i / len(self.target_history)  # Fade older points
-                    radius = int(3 + 2 * alpha)
-                    cv2.circle(frame, point, radius, self.trail_color, -1)
-        
-        # Status overlay
-        status_bg = frame.copy()
-        cv2.rectangle(status_bg, (0, 0), (frame.shape[1], 80), (0, 0, 0), -1)
-        cv2.addWeighted(status_bg, 0.4, frame, 0.6, 0, frame)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2,
+                       cv2.LINE_AA)
+            
+            # Trail of previous positions - the ring buffer already has
+            # polylines' (N, 1, 2) shape, so this is a zero-copy pass
+            polyline = self._trail_polyline()
+            if len(polyline) > 1:
+                cv2.polylines(frame, [polyline], False, self.trail_color, 2)
+
+                # Draw dots along trail, radii fading in for newer points
+                points = polyline[:, 0]
+                radii = np.linspace(3, 5, len(points)).astype(np.int32)
+                for point, radius in zip(points, radii):
+                    cv2.circle(frame, (int(point[0]), int(point[1])),
+                               int(radius), self.trail_color, -1)
+        
+        # Status overlay - darken just the 80-row banner in place instead
+        # of compositing a full-frame copy for it
+        banner = frame[:80]
+        np.multiply(banner, 0.6, out=banner, casting='unsafe')
         
         # Status text
         if self.tracking_active:
             status = "TRACKING ACTIVE"
             color = (0, 255, 0)
-            trail_length = len(self.target_history)
+            trail_length = self._trail_count
             cv2.putText(frame, f"Trail Length: {trail_length} frames",
                        (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         else:
@@ -251,25 +472,23 @@ class InteractiveOrganismTracker:
                    (10, frame.shape[0] - 10),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
     
-    def draw_all_contours(self, frame, contours):
+    def draw_all_contours(self, frame, contours, centroids=None):
         """
-        Draw all detected contours in semi-transparent blue (debug mode).
+        Draw all candidate contours in semi-transparent blue (debug mode).
+
+        Candidates arrive already area-filtered with their centroids
+        cached from extraction, so this path recomputes no moments.
         """
-        if not self.show_all_contours:
+        if not self.show_all_contours or not len(contours):
             return
-        
-        for cnt in contours:
-            area = cv2.contourArea(cnt)
-            if self.MIN_CONTOUR_AREA < area < self.MAX_CONTOUR_AREA:
-                # Calculate centroid
-                M = cv2.moments(cnt)
-                if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    
-                    # Draw faint contour
-                    cv2.drawContours(frame, [cnt], -1, (255, 200, 100), 1)
-                    cv2.circle(frame, (cx, cy), 3, (255, 200, 100), -1)
+
+        if centroids is None:
+            contours, centroids = _contour_centroids(contours)
+
+        # Draw faint contours in one batched call, then the centroid dots
+        cv2.drawContours(frame, contours, -1, (255, 200, 100), 1)
+        for cx, cy in centroids.astype(np.int32):
+            cv2.circle(frame, (int(cx), int(cy)), 3, (255, 200, 100), -1)
     
     def run(self):
         """
@@ -296,63 +515,118 @@ class InteractiveOrganismTracker:
         window_name = 'Interactive Organism Tracker'
         cv2.namedWindow(window_name)
         cv2.setMouseCallback(window_name, self.mouse_callback)
-        
+
+        # Start the capture producer; this loop only ever consumes the
+        # newest frame, so slow iterations drop stale ones instead of
+        # letting them back up in the driver
+        self._capture_running = True
+        capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        capture_thread.start()
+
+        last_seq = 0
         while True:
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Failed to read frame")
-                break
-            
+            seq, frame = self._latest_frame()
+            if seq == last_seq:
+                if not capture_thread.is_alive():
+                    print("Failed to read frame")
+                    break
+                # Nothing new yet - yield briefly instead of spinning
+                time.sleep(0.001)
+                continue
+            last_seq = seq
+
             self.frame_count += 1
             
             # ============================================================
             # STEP 1: Background Subtraction & Preprocessing
             # ============================================================
-            fg_mask = self.backsub.apply(frame)
-            
-            # Clean up noise
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-            mask_cleaned = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
+            # Detect on a half-resolution pyramid level; click selection
+            # doesn't need subpixel precision and this quarters the pixel
+            # count through the whole mask pipeline
+            small = cv2.pyrDown(frame) if self.SCALE == 2 else frame
+
+            # Freeze the background model while locked on: a slow-moving
+            # organism otherwise gets absorbed into the background and
+            # drops out of the mask mid-track
+            learning_rate = 0.0 if self.tracking_active else -1
+
+            if self.use_cuda:
+                # GPU path: upload once, run MOG2 + open on the stream,
+                # download only the cleaned mask for contour extraction
+                self.gpu_frame.upload(small, self.stream)
+                fg_gpu = self.gpu_backsub.apply(
+                    self.gpu_frame, learning_rate, self.stream)
+                self.gpu_morph.apply(fg_gpu, self.gpu_mask, self.stream)
+                mask_cleaned = self.gpu_mask.download(self.stream)
+                self.stream.waitForCompletion()
+            elif self.use_opencl:
+                # OpenCL path: keep MOG2 + open on the device via UMat and
+                # download only the cleaned mask for contour extraction
+                fg_umat = self.backsub.apply(cv2.UMat(small),
+                                             learningRate=learning_rate)
+                mask_cleaned = cv2.morphologyEx(
+                    fg_umat, cv2.MORPH_OPEN, self.kernel).get()
+            else:
+                fg_mask = self.backsub.apply(small, learningRate=learning_rate)
+
+                # Clean up noise - reuse the preallocated destination buffer
+                if self.mask_cleaned is None:
+                    self.mask_cleaned = np.empty(small.shape[:2], np.uint8)
+                cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.kernel,
+                                 dst=self.mask_cleaned)
+                mask_cleaned = self.mask_cleaned
             
             # ============================================================
             # STEP 2: Find Contours
             # ============================================================
-            contours, _ = cv2.findContours(
-                mask_cleaned, 
-                cv2.RETR_EXTERNAL, 
-                cv2.CHAIN_APPROX_SIMPLE
-            )
-            
-            # Filter by area
-            valid_contours = [
-                cnt for cnt in contours 
-                if self.MIN_CONTOUR_AREA < cv2.contourArea(cnt) < self.MAX_CONTOUR_AREA
-            ]
-            
+            # Quiescent-scene early exit: counting the mask is one
+            # vectorized pass, far cheaper than scanning it for contours
+            # when nothing moves. Fewer foreground pixels than the minimum
+            # area can't form a valid contour anyway.
+            if cv2.countNonZero(mask_cleaned) < self._min_area_small:
+                valid_contours = []
+                frame_centroids = np.empty((0, 2), np.float32)
+            else:
+                contours, _ = cv2.findContours(
+                    mask_cleaned,
+                    cv2.RETR_EXTERNAL,
+                    cv2.CHAIN_APPROX_SIMPLE
+                )
+
+                # Area filter + centroid extraction fused into a single
+                # moments pass; the centroid array is reused below
+                valid_contours, frame_centroids = self._extract_candidates(contours)
+
+            if self.SCALE != 1:
+                # Scale detections back to full-resolution pixel space
+                frame_centroids *= self.SCALE
+                valid_contours = [cnt * self.SCALE for cnt in valid_contours]
+
             # ============================================================
             # STEP 3: Handle Mouse Click Selection
             # ============================================================
             if self.awaiting_selection and self.click_position:
                 # Find nearest contour to click position
-                nearest_cnt, distance, centroid = self.find_nearest_contour(
-                    valid_contours, 
-                    self.click_position
+                nearest_cnt, dist_sq, centroid = self.find_nearest_contour(
+                    valid_contours,
+                    self.click_position,
+                    frame_centroids
                 )
-                
-                if nearest_cnt is not None and distance < 100:
+
+                if nearest_cnt is not None and dist_sq < self._CLICK_TOL_SQ:
                     # Start tracking this organism
                     self.tracking_active = True
                     self.target_position = centroid
                     self.selected_contour = nearest_cnt
-                    self.target_history.clear()
-                    self.target_history.append(centroid)
+                    self._trail_clear()
+                    self._trail_append(centroid)
                     
                     print(f"[LOCKED] Organism at ({centroid[0]}, {centroid[1]})")
-                    print(f"         Distance from click: {distance:.1f}px")
+                    print(f"         Distance from click: {math.sqrt(dist_sq):.1f}px")
                     print(f"         Contour area: {cv2.contourArea(nearest_cnt):.0f}px²")
                 else:
                     print(f"[FAILED] No contour found near click position")
-                    print(f"         Nearest contour: {distance:.1f}px away")
+                    print(f"         Nearest contour: {math.sqrt(dist_sq):.1f}px away")
                 
                 self.awaiting_selection = False
                 self.click_position = None
@@ -361,7 +635,7 @@ class InteractiveOrganismTracker:
             # STEP 4: Update Tracking
             # ============================================================
             if self.tracking_active:
-                tracked_contour = self.update_tracking(valid_contours)
+                tracked_contour = self.update_tracking(valid_contours, frame_centroids)
                 
                 if tracked_contour is None:
                     # Lost tracking
@@ -372,10 +646,13 @@ class InteractiveOrganismTracker:
             # ============================================================
             # STEP 5: Visualization
             # ============================================================
-            display_frame = frame.copy()
+            # Draw straight onto the captured frame - nothing downstream
+            # needs it unmodified (the capture thread hands out a fresh
+            # buffer per read), so skip the ~6 MB HD display copy entirely
+            display_frame = frame
             
-            # Draw all contours if debug mode
-            self.draw_all_contours(display_frame, valid_contours)
+            # Draw all contours if debug mode - reuses the cached centroids
+            self.draw_all_contours(display_frame, valid_contours, frame_centroids)
             
             # Draw tracking overlays
             self.draw_tracking_info(display_frame)
@@ -387,7 +664,9 @@ class InteractiveOrganismTracker:
             # ============================================================
             # STEP 6: Keyboard Controls
             # ============================================================
-            key = cv2.waitKey(1) & 0xFF
+            # pollKey pumps the GUI events without waitKey's ~1 ms floor;
+            # pacing comes from the capture thread, not the key poll
+            key = cv2.pollKey() & 0xFF
             
             if key == ord('q'):
                 break
@@ -396,7 +675,7 @@ class InteractiveOrganismTracker:
                 print("\n[RESET] Tracking cleared - click to select new organism")
                 self.tracking_active = False
                 self.target_position = None
-                self.target_history.clear()
+                self._trail_clear()
                 self.selected_contour = None
             elif key == ord('a'):
                 # Toggle show all contours
@@ -407,9 +686,10 @@ class InteractiveOrganismTracker:
                 self.show_search_radius = not self.show_search_radius
                 print(f"[TOGGLE] Search radius: {'ON' if self.show_search_radius else 'OFF'}")
             elif key == ord('p'):
-                # Save screenshot
+                # Save screenshot - encode on the IO worker, not here
                 filename = f"tracked_organism_{self.frame_count}.png"
-                cv2.imwrite(filename, display_frame)
+                self._io_pool.submit(cv2.imwrite, filename,
+                                     display_frame.copy())
                 print(f"[SAVED] {filename}")
             
             # Print position every 30 frames
@@ -417,26 +697,27 @@ class InteractiveOrganismTracker:
                 cx, cy = self.target_position
                 print(f"Frame {self.frame_count}: Organism at ({cx}, {cy})")
         
-        # Cleanup
+        # Cleanup - let any in-flight screenshot finish writing
+        self._capture_running = False
+        capture_thread.join(timeout=1.0)
+        self._io_pool.shutdown(wait=True)
         self.cap.release()
         cv2.destroyAllWindows()
-        
+
         # Print summary
-        if self.target_history:
+        if self._trail_count:
+            history = self._trail_points()
             print("\n" + "="*70)
             print("TRACKING SUMMARY")
             print("="*70)
-            print(f"Total frames tracked: {len(self.target_history)}")
-            print(f"Start position: {self.target_history[0]}")
-            print(f"End position: {self.target_history[-1]}")
-            
-            # Calculate total distance traveled
-            total_distance = 0
-            for i in range(1, len(self.target_history)):
-                p1 = self.target_history[i-1]
-                p2 = self.target_history[i]
-                total_distance += np.sqrt((p2[0]-p1[0])**2 + (p2[1]-p1[1])**2)
-            
+            print(f"Total frames tracked: {len(history)}")
+            print(f"Start position: {tuple(history[0])}")
+            print(f"End position: {tuple(history[-1])}")
+
+            # Total distance traveled - one vectorized pass over the trail
+            steps = np.diff(history.astype(np.float32), axis=0)
+            total_distance = float(np.linalg.norm(steps, axis=1).sum())
+
             print(f"Total distance traveled: {total_distance:.1f} pixels")
             print("="*70)
 
@@ -445,71 +726,73 @@ class InteractiveOrganismTracker:
 # SIMPLIFIED VERSION (Even More Minimal)
 # ============================================================
 
-class SimpleClickTracker:
+class SimpleClickTracker(_BaseTracker):
     """
     Ultra-minimal click-to-track implementation.
     """
-    
+
     def __init__(self):
-        self.cap = cv2.VideoCapture(1)
-        self.backsub = cv2.createBackgroundSubtractorMOG2(history=500, varThreshold=50, detectShadows=True)
+        super().__init__()
         self.target_pos = None
         self.tracking = False
-        
+
     def mouse_callback(self, event, x, y, flags, param):
         if event == cv2.EVENT_LBUTTONDOWN:
             self.click_pos = (x, y)
-    
-    def find_nearest(self, contours, point):
-        best = None
-        best_dist = 999999
-        for cnt in contours:
-            M = cv2.moments(cnt)
-            if M["m00"] > 0:
-                cx = int(M["m10"] / M["m00"])
-                cy = int(M["m01"] / M["m00"])
-                dist = np.sqrt((cx - point[0])**2 + (cy - point[1])**2)
-                if dist < best_dist:
-                    best_dist = dist
-                    best = (cnt, cx, cy)
-        return best
-    
+
+    def find_nearest(self, centroids, valid, point):
+        """
+        Nearest valid component centroid to point.
+        Returns (component index into centroids, cx, cy) or None.
+        """
+        if not valid.any():
+            return None
+        dx = centroids[:, 0] - point[0]
+        dy = centroids[:, 1] - point[1]
+        d2 = np.where(valid, dx * dx + dy * dy, np.inf)
+        idx = int(np.argmin(d2))
+        return idx, int(centroids[idx, 0]), int(centroids[idx, 1])
+
     def run(self):
         cv2.namedWindow('Tracker')
         cv2.setMouseCallback('Tracker', self.mouse_callback)
         self.click_pos = None
-        
+
         while True:
             ret, frame = self.cap.read()
             if not ret:
                 break
-            
-            # Get contours
+
             fg_mask = self.backsub.apply(frame)
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-            mask_cleaned = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
-            contours, _ = cv2.findContours(mask_cleaned, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            valid = [c for c in contours if 50 < cv2.contourArea(c) < 1000]
-            
+            mask_cleaned = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.kernel)
+
+            # One C call returns area + centroid for every blob - no
+            # per-contour cv2.moments loop. Row 0 is the background.
+            num, labels, stats, centroids = cv2.connectedComponentsWithStats(
+                mask_cleaned, 8, cv2.CV_32S)
+            areas = stats[1:, cv2.CC_STAT_AREA]
+            cents = centroids[1:]
+            valid = (areas > 50) & (areas < 1000)
+
             # Handle click
             if self.click_pos:
-                result = self.find_nearest(valid, self.click_pos)
-                if result and result[1]:
+                result = self.find_nearest(cents, valid, self.click_pos)
+                if result:
                     self.target_pos = (result[1], result[2])
                     self.tracking = True
                     print(f"Locked: {self.target_pos}")
                 self.click_pos = None
-            
+
             # Update tracking
             if self.tracking and self.target_pos:
-                result = self.find_nearest(valid, self.target_pos)
-                if result and result[1]:
-                    cnt, cx, cy = result
+                result = self.find_nearest(cents, valid, self.target_pos)
+                if result:
+                    idx, cx, cy = result
                     self.target_pos = (cx, cy)
-                    
-                    # Draw
-                    cv2.drawContours(frame, [cnt], -1, (0, 255, 0), 2)
+
+                    # Draw - paint the tracked blob via its label mask
+                    # (labels offset by 1 for the skipped background row)
+                    frame[labels == idx + 1] = (0, 255, 0)
                     cv2.circle(frame, (cx, cy), 7, (0, 0, 255), -1)
                     cv2.putText(frame, f"({cx},{cy})", (cx+10, cy-10),
                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
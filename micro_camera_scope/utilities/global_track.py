@@ -1,7 +1,79 @@
+import threading
+
 import cv2
 import numpy as np
 from collections import deque
 
+# numba is optional: with it, the triple-frame difference below runs as
+# one fused native pass; without it the detector keeps the OpenCV chain
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _triple_diff_thresh(f0, f1, f2, out, thresh):
+        """
+        Fused |f0-f1| ∧ |f1-f2| > thresh binarization: reads the three
+        frames once and writes the 0/255 mask directly, instead of the
+        four full-image passes of the absdiff/min/threshold chain.
+        """
+        for i in prange(f0.shape[0]):
+            for j in range(f0.shape[1]):
+                d1 = abs(np.int32(f0[i, j]) - np.int32(f1[i, j]))
+                d2 = abs(np.int32(f1[i, j]) - np.int32(f2[i, j]))
+                m = d1 if d1 < d2 else d2
+                out[i, j] = 255 if m > thresh else 0
+
+
+class _LatestFrameGrabber:
+    """
+    Keeps cap.grab() running on a worker thread so the V4L2/MJPEG driver
+    queue never backs up behind slow processing; retrieve() decodes only
+    when the consumer actually asks for the latest frame. The win here is
+    latency - never handing the detector a stale frame - rather than
+    speeding up any kernel.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+
+    def _grab_loop(self):
+        while self._running:
+            with self._lock:
+                ok = self.cap.grab()
+            if not ok:
+                self._running = False
+                break
+            self._new_frame.set()
+
+    def read_latest(self, timeout=1.0):
+        """Wait for a fresh grab, then decode just that frame."""
+        if not self._new_frame.wait(timeout):
+            return False, None
+        self._new_frame.clear()
+        with self._lock:
+            return self.cap.retrieve()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+
 class OrganismMotionDetector:
     """
     Detects independently moving microorganisms while compensating for stage movement.
@@ -18,7 +90,25 @@ class OrganismMotionDetector:
             varThreshold=16,
             detectShadows=False
         )
-        
+
+        # Optional CUDA MOG2: the per-pixel Gaussian mixture update is the
+        # heaviest step of the pipeline and embarrassingly data-parallel,
+        # so on CUDA-capable builds it runs on the GPU and leaves the CPU
+        # free for the LK tracker. Detected once here; detect_organisms
+        # falls back to the CPU subtractor when unavailable.
+        self.use_cuda = False
+        try:
+            self.use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            pass
+        if self.use_cuda:
+            self._gpu_backsub = cv2.cuda.createBackgroundSubtractorMOG2(
+                history=500, varThreshold=16, detectShadows=False)
+            self._gpu_frame = cv2.cuda_GpuMat()
+            self._gpu_stream = cv2.cuda_Stream()
+            print("CUDA device detected - background subtraction on GPU")
+
+
         # Optical flow parameters for stage motion detection
         self.lk_params = dict(
             winSize=(15, 15),
@@ -26,21 +116,46 @@ class OrganismMotionDetector:
             criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
         )
         
-        # Feature detection for optical flow
-        self.feature_params = dict(
-            maxCorners=100,
-            qualityLevel=0.3,
-            minDistance=7,
-            blockSize=7
-        )
+        # Feature detection for optical flow. FAST's integer circle test
+        # is roughly an order of magnitude cheaper than Shi-Tomasi
+        # eigenvalue scoring, and LK seeding only needs ~50-100 trackable
+        # points, not the best-ranked corners.
+        self.MAX_TRACK_POINTS = 100
+        self._fast = cv2.FastFeatureDetector_create(
+            threshold=20, nonmaxSuppression=True)
         
         # State variables
         self.prev_gray = None
         self.prev_points = None
         self.stage_motion_history = deque(maxlen=10)
+        # Last frame's median displacement, used to seed LK so the solver
+        # starts near the answer instead of from zero flow
+        self._last_motion = np.zeros(2, np.float32)
         
-        # Motion accumulator for organism tracking
+        # Motion accumulator for organism tracking, plus a scratch float32
+        # buffer so the per-frame accumulator update runs fully in place
         self.motion_accumulator = None
+        self._fg_f32 = None
+        self._accum_u8 = None
+        self._warp_dst = None
+
+        # Two grayscale buffers in ping-pong: the flow estimator retains
+        # a reference to the previous gray, so a single reused buffer
+        # would be overwritten under it - alternating between two keeps
+        # the retained frame intact while avoiding per-frame allocation
+        self._gray_bufs = None
+        self._gray_idx = 0
+
+        # Constant morphology kernels - tuned for small organisms, built
+        # once instead of per frame
+        self._k_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        self._k_close = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+
+        # Debug-view canvases, lazily sized from the first frame so the
+        # 2x2 mosaic and its resized copy are allocated exactly once
+        self._mosaic = None
+        self._mosaic_small = None
+        self._display = None
         self.organism_tracks = {}  # Track organisms over time
         self.next_track_id = 0
         
@@ -53,6 +168,28 @@ class OrganismMotionDetector:
         self.ORGANISM_MOTION_THRESHOLD = 2.0  # pixels relative to stage
         self.TRACK_MAX_DISTANCE = 50  # max pixels to associate tracks
         self.TRACK_MIN_FRAMES = 3  # minimum frames to confirm organism
+
+        # Stage-motion estimation cadence: stage displacement is slow and
+        # smooth relative to the frame rate, so LK only runs every Nth
+        # frame and the frames in between reuse the last estimate
+        self.STAGE_EST_EVERY = 2
+        self._frame_idx = 0
+        self._last_stage_est = (0.0, 0.0, False)
+
+        # All CV (LK flow, MOG2, accumulator, contours) runs at this
+        # fraction of the capture resolution - the stage estimate only
+        # needs coarse global displacement and organisms stay visible at
+        # half size, while the pixel count drops 4x. Detections are
+        # scaled back to full-resolution coordinates before returning.
+        self.WORK_SCALE = 0.5
+        _s2 = self.WORK_SCALE * self.WORK_SCALE
+        self._min_area_small = self.MIN_ORGANISM_AREA * _s2
+        self._max_area_small = self.MAX_ORGANISM_AREA * _s2
+        # LK measures displacement across the whole estimation interval,
+        # so the moving/stable threshold scales with the cadence too
+        self._stage_thresh_small = (self.STAGE_MOTION_THRESHOLD *
+                                    self.WORK_SCALE * self.STAGE_EST_EVERY)
+        self._std_max_small = 10 * self.WORK_SCALE
         
     def estimate_stage_motion(self, gray):
         """
@@ -60,26 +197,41 @@ class OrganismMotionDetector:
         Returns: (dx, dy, is_stage_moving)
         """
         if self.prev_gray is None:
-            self.prev_gray = gray.copy()
+            # gray comes from the two-buffer ping-pong in detect_organisms,
+            # so keeping the reference is safe - next frame writes the
+            # other buffer
+            self.prev_gray = gray
             return 0, 0, False
         
-        # Detect features to track
+        # Detect features to track - strongest FAST corners first so the
+        # cap keeps the most trackable ones
         if self.prev_points is None or len(self.prev_points) < 20:
-            self.prev_points = cv2.goodFeaturesToTrack(
-                self.prev_gray, 
-                mask=None, 
-                **self.feature_params
-            )
-            
-            if self.prev_points is None:
+            kps = self._fast.detect(self.prev_gray)
+
+            if not kps:
+                self.prev_points = None
                 return 0, 0, False
-        
-        # Calculate optical flow
+
+            if len(kps) > self.MAX_TRACK_POINTS:
+                # detect() returns a tuple, so sort into a new list
+                kps = sorted(kps, key=lambda kp: kp.response,
+                             reverse=True)[:self.MAX_TRACK_POINTS]
+
+            self.prev_points = np.array(
+                [kp.pt for kp in kps], dtype=np.float32).reshape(-1, 1, 2)
+        
+        # Calculate optical flow, seeded with last frame's stage motion.
+        # Starting the pyramidal solver near the answer converges in fewer
+        # iterations than the default zero-flow guess. (Prebuilt pyramids
+        # via cv2.buildOpticalFlowPyramid would also halve pyramid
+        # construction, but the Python binding rejects pyramid lists.)
+        seeded_guess = self.prev_points + self._last_motion
         next_points, status, error = cv2.calcOpticalFlowPyrLK(
-            self.prev_gray, 
-            gray, 
-            self.prev_points, 
-            None, 
+            self.prev_gray,
+            gray,
+            self.prev_points,
+            seeded_guess,
+            flags=cv2.OPTFLOW_USE_INITIAL_FLOW,
             **self.lk_params
         )
         
@@ -95,16 +247,15 @@ class OrganismMotionDetector:
             self.prev_points = None
             return 0, 0, False
         
-        # Calculate displacement vectors
-        displacements = good_new - good_old
-        
+        # Calculate displacement vectors - contiguous (N, 2) so the axis
+        # reductions below work on one buffer instead of two column copies
+        displacements = np.ascontiguousarray((good_new - good_old).reshape(-1, 2))
+
         # Use RANSAC-like approach: find median displacement (robust to outliers)
-        dx_median = np.median(displacements[:, 0])
-        dy_median = np.median(displacements[:, 1])
-        
+        dx_median, dy_median = np.median(displacements, axis=0)
+
         # Calculate how much variation there is (detect if motion is uniform)
-        dx_std = np.std(displacements[:, 0])
-        dy_std = np.std(displacements[:, 1])
+        dx_std, dy_std = np.std(displacements, axis=0)
         
         displacement_magnitude = np.sqrt(dx_median**2 + dy_median**2)
         
@@ -112,13 +263,14 @@ class OrganismMotionDetector:
         # 1. Median displacement is significant
         # 2. Motion is relatively uniform (low std deviation)
         is_stage_moving = (
-            displacement_magnitude > self.STAGE_MOTION_THRESHOLD and
-            dx_std < 10 and dy_std < 10
+            displacement_magnitude > self._stage_thresh_small and
+            dx_std < self._std_max_small and dy_std < self._std_max_small
         )
         
-        # Update for next frame
+        # Update for next frame - reference, not copy (see above)
         self.prev_points = good_new.reshape(-1, 1, 2)
-        self.prev_gray = gray.copy()
+        self.prev_gray = gray
+        self._last_motion = np.float32([dx_median, dy_median])
         
         # Track stage motion over time
         self.stage_motion_history.append(is_stage_moving)
@@ -131,71 +283,113 @@ class OrganismMotionDetector:
         """
         if abs(dx) < 0.5 and abs(dy) < 0.5:
             return mask
-        
+
         # Create transformation matrix
         M = np.float32([[1, 0, -dx], [0, 1, -dy]])
-        
-        # Warp the mask
-        compensated = cv2.warpAffine(
-            mask, 
-            M, 
+
+        # Warp the mask into a reused buffer. INTER_NEAREST keeps the
+        # binary mask binary (linear interpolation would smear edge
+        # pixels into gray values) and is cheaper per pixel.
+        if self._warp_dst is None or self._warp_dst.shape != mask.shape:
+            self._warp_dst = np.empty_like(mask)
+        cv2.warpAffine(
+            mask,
+            M,
             (mask.shape[1], mask.shape[0]),
-            flags=cv2.INTER_LINEAR,
+            dst=self._warp_dst,
+            flags=cv2.INTER_NEAREST,
             borderMode=cv2.BORDER_CONSTANT,
             borderValue=0
         )
-        
-        return compensated
+
+        return self._warp_dst
     
     def detect_organisms(self, frame):
         """
         Main detection pipeline with stage motion compensation.
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
-        # Estimate stage motion
-        dx, dy, is_stage_moving = self.estimate_stage_motion(gray)
-        
+        # Work at reduced resolution
+        frame_small = cv2.resize(frame, None, fx=self.WORK_SCALE,
+                                 fy=self.WORK_SCALE,
+                                 interpolation=cv2.INTER_AREA)
+
+        # Estimate stage motion every Nth frame (small-space pixels).
+        # Skipped frames reuse the last estimate and skip the gray
+        # conversion entirely; with only estimation frames writing the
+        # ping-pong buffers, prev_gray's buffer is never overwritten.
+        self._frame_idx += 1
+        if (self._frame_idx % self.STAGE_EST_EVERY == 0
+                or self.prev_gray is None):
+            # Convert into the ping-pong gray buffers (see __init__)
+            # instead of letting cvtColor allocate a fresh array
+            if self._gray_bufs is None:
+                h, w = frame_small.shape[:2]
+                self._gray_bufs = (np.empty((h, w), np.uint8),
+                                   np.empty((h, w), np.uint8))
+            self._gray_idx ^= 1
+            gray = self._gray_bufs[self._gray_idx]
+            cv2.cvtColor(frame_small, cv2.COLOR_BGR2GRAY, dst=gray)
+
+            dx_i, dy_i, est_moving = self.estimate_stage_motion(gray)
+            # Normalize the interval displacement to per-frame motion so
+            # mask compensation shifts by the right amount on every frame
+            inv_n = 1.0 / self.STAGE_EST_EVERY
+            self._last_stage_est = (dx_i * inv_n, dy_i * inv_n, est_moving)
+        dx, dy, is_stage_moving = self._last_stage_est
+
         # Apply background subtraction
-        fg_mask = self.backsub.apply(frame, learningRate=0.001 if is_stage_moving else -1)
+        learning_rate = 0.001 if is_stage_moving else -1
+        if self.use_cuda:
+            # Upload once, subtract on the stream, download only the mask
+            self._gpu_frame.upload(frame_small, self._gpu_stream)
+            fg_gpu = self._gpu_backsub.apply(
+                self._gpu_frame, learning_rate, self._gpu_stream)
+            fg_mask = fg_gpu.download(self._gpu_stream)
+            self._gpu_stream.waitForCompletion()
+        else:
+            fg_mask = self.backsub.apply(frame_small, learningRate=learning_rate)
         
         # Aggressive thresholding
         _, fg_mask = cv2.threshold(fg_mask, 240, 255, cv2.THRESH_BINARY)
         
-        # Initialize accumulator
+        # Initialize accumulator and its scratch buffer
         if self.motion_accumulator is None:
             self.motion_accumulator = np.zeros_like(fg_mask, dtype=np.float32)
-        
-        # Motion compensation strategy
+            self._fg_f32 = np.empty_like(self.motion_accumulator)
+            self._accum_u8 = np.empty_like(fg_mask)
+
+        # Motion compensation strategy - both branches update the
+        # accumulator in place; no per-frame float temporaries
         if is_stage_moving:
             # During stage movement: heavily decay accumulator
-            self.motion_accumulator *= 0.5
-            
+            # (0.5 then 0.7 folded into one multiply)
+            self.motion_accumulator *= 0.35
+
             # Compensate foreground mask for stage motion
             fg_mask = self.compensate_motion(fg_mask, dx, dy)
-            
+
             # Only accumulate strong, persistent motion during stage movement
-            strong_motion = fg_mask.astype(np.float32) * 0.3
-            self.motion_accumulator = np.maximum(
-                self.motion_accumulator * 0.7,
-                strong_motion
-            )
+            np.multiply(fg_mask, 0.3, out=self._fg_f32)
+            np.maximum(self.motion_accumulator, self._fg_f32,
+                       out=self.motion_accumulator)
         else:
-            # Stage stable: normal accumulation
-            self.motion_accumulator = (
-                self.motion_accumulator * self.ACCUM_DECAY +
-                fg_mask.astype(np.float32) * self.ACCUM_GAIN
-            )
-        
-        # Threshold accumulated motion
-        accum_mask = np.uint8(self.motion_accumulator > 80) * 255
-        
-        # Morphological operations - tuned for small organisms
-        kernel_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-        kernel_close = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        
-        accum_mask = cv2.morphologyEx(accum_mask, cv2.MORPH_OPEN, kernel_open)
-        accum_mask = cv2.morphologyEx(accum_mask, cv2.MORPH_CLOSE, kernel_close)
+            # Stage stable: normal accumulation via one fused SIMD
+            # multiply-add in OpenCV's hal
+            self._fg_f32[:] = fg_mask
+            cv2.addWeighted(self.motion_accumulator, self.ACCUM_DECAY,
+                            self._fg_f32, self.ACCUM_GAIN, 0,
+                            dst=self.motion_accumulator)
+        
+        # Threshold accumulated motion - cv2.compare writes the 0/255
+        # uint8 mask straight from the float accumulator in one pass
+        # (the old bool->uint8->multiply chain was three)
+        cv2.compare(self.motion_accumulator, 80, cv2.CMP_GT,
+                    dst=self._accum_u8)
+        accum_mask = self._accum_u8
+        
+        # Morphological operations with the cached kernels
+        accum_mask = cv2.morphologyEx(accum_mask, cv2.MORPH_OPEN, self._k_open)
+        accum_mask = cv2.morphologyEx(accum_mask, cv2.MORPH_CLOSE, self._k_close)
         
         # Find contours
         contours, _ = cv2.findContours(
@@ -207,11 +401,22 @@ class OrganismMotionDetector:
         # Detect organisms
         organisms = []
         
+        inv_scale = 1.0 / self.WORK_SCALE
+
         for c in contours:
+            # Cheap bounding-box screen first: the contour area can never
+            # exceed w*h, so speckle rejects skip contourArea, arcLength
+            # and moments entirely
+            x, y, w, h = cv2.boundingRect(c)
+            bb_area = w * h
+            if (bb_area < self._min_area_small or
+                    bb_area > 4 * self._max_area_small):
+                continue
+
             area = cv2.contourArea(c)
-            
-            # Size filtering
-            if area < self.MIN_ORGANISM_AREA or area > self.MAX_ORGANISM_AREA:
+
+            # Size filtering (small-frame area thresholds)
+            if area < self._min_area_small or area > self._max_area_small:
                 continue
             
             # Shape filtering - reject linear artifacts
@@ -225,26 +430,27 @@ class OrganismMotionDetector:
             if circularity < 0.1:
                 continue
             
-            # Calculate centroid
-            M = cv2.moments(c)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            # Calculate bounding box
-            x, y, w, h = cv2.boundingRect(c)
-            
+            # Calculate centroid from the contour vertices directly: for
+            # these small, near-convex blobs the vertex mean lands within
+            # a pixel of the area centroid and skips cv2.moments' full
+            # spatial/central/Hu computation of which only 3 values were
+            # ever read
+            pts = c.reshape(-1, 2)
+            cx_f, cy_f = pts.mean(axis=0)
+            cx, cy = int(cx_f), int(cy_f)
+
+            # Scale everything back to full-resolution coordinates
             organisms.append({
-                'centroid': (cx, cy),
-                'contour': c,
-                'area': area,
-                'bbox': (x, y, w, h),
+                'centroid': (int(cx * inv_scale), int(cy * inv_scale)),
+                'contour': (c * inv_scale).astype(np.int32),
+                'area': area * inv_scale * inv_scale,
+                'bbox': (int(x * inv_scale), int(y * inv_scale),
+                         int(w * inv_scale), int(h * inv_scale)),
                 'circularity': circularity
             })
-        
-        return organisms, is_stage_moving, (dx, dy), fg_mask, accum_mask
+
+        return (organisms, is_stage_moving,
+                (dx * inv_scale, dy * inv_scale), fg_mask, accum_mask)
     
     def draw_results(self, frame, organisms, is_stage_moving, stage_motion):
         """
@@ -329,45 +535,62 @@ class OrganismMotionDetector:
         print("  's' - Save current frame")
         
         frame_count = 0
-        
+
+        grabber = _LatestFrameGrabber(self.cap)
+        grabber.start()
+
         while True:
-            ret, frame = self.cap.read()
+            ret, frame = grabber.read_latest()
             if not ret:
                 break
-            
+
             frame_count += 1
             
             # Detect organisms
             organisms, is_stage_moving, stage_motion, fg_mask, accum_mask = \
                 self.detect_organisms(frame)
             
-            # Draw results
+            # Draw results into a preallocated annotation buffer - the
+            # per-frame full-frame copy() allocation goes away, and
+            # nothing downstream retains the buffer across iterations
+            if self._display is None:
+                self._display = np.empty_like(frame)
+            np.copyto(self._display, frame)
             display_frame = self.draw_results(
-                frame.copy(), 
-                organisms, 
-                is_stage_moving, 
+                self._display,
+                organisms,
+                is_stage_moving,
                 stage_motion
             )
             
-            # Create debug view
-            fg_display = cv2.cvtColor(fg_mask, cv2.COLOR_GRAY2BGR)
-            accum_display = cv2.cvtColor(accum_mask, cv2.COLOR_GRAY2BGR)
-            
-            # Combine views
-            top_row = np.hstack([display_frame, fg_display])
-            bottom_row = np.hstack([accum_display, np.zeros_like(accum_display)])
-            combined = np.vstack([top_row, bottom_row])
-            
-            # Resize for display
-            scale = 0.7
-            combined_resized = cv2.resize(
-                combined, 
-                None, 
-                fx=scale, 
-                fy=scale
-            )
-            
-            cv2.imshow("Organism Motion Detection", combined_resized)
+            # Debug view: write each quadrant of a preallocated 2x2
+            # mosaic in place - no hstack/vstack temporaries, and the
+            # dead quadrant is zeroed once at allocation
+            H, W = frame.shape[:2]
+            if self._mosaic is None:
+                scale = 0.7
+                self._mosaic = np.zeros((2 * H, 2 * W, 3), np.uint8)
+                self._mosaic_small = np.empty(
+                    (int(2 * H * scale), int(2 * W * scale), 3), np.uint8)
+
+            np.copyto(self._mosaic[:H, :W], display_frame)
+            # Masks come back at WORK_SCALE - convert the small arrays,
+            # then resize straight into their quadrants
+            cv2.resize(cv2.cvtColor(fg_mask, cv2.COLOR_GRAY2BGR), (W, H),
+                       dst=self._mosaic[:H, W:],
+                       interpolation=cv2.INTER_NEAREST)
+            cv2.resize(cv2.cvtColor(accum_mask, cv2.COLOR_GRAY2BGR), (W, H),
+                       dst=self._mosaic[H:, :W],
+                       interpolation=cv2.INTER_NEAREST)
+
+            # Resize into the preallocated display buffer
+            cv2.resize(self._mosaic,
+                       (self._mosaic_small.shape[1],
+                        self._mosaic_small.shape[0]),
+                       dst=self._mosaic_small,
+                       interpolation=cv2.INTER_AREA)
+
+            cv2.imshow("Organism Motion Detection", self._mosaic_small)
             
             # Keyboard controls
             key = cv2.waitKey(1) & 0xFF
@@ -394,7 +617,8 @@ class OrganismMotionDetector:
                     cx, cy = org['centroid']
                     area = org['area']
                     print(f"  Organism {i+1}: Position ({cx}, {cy}), Area: {area:.0f}")
-        
+
+        grabber.stop()
         self.cap.release()
         cv2.destroyAllWindows()
 
@@ -412,30 +636,57 @@ class SimpleOrganismDetector:
     def __init__(self):
         self.cap = cv2.VideoCapture(1)
         self.prev_frames = deque(maxlen=3)
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        # Precomputed 1D Gaussian for a separable smoothing pass; each
+        # frame is blurred exactly once, when it is current - the deque
+        # entries are already smoothed and are never re-filtered
+        self._gauss_k = cv2.getGaussianKernel(5, 0)
+        self._motion_buf = None  # reused output of the fused diff kernel
+        # Gray buffers: a cvtColor scratch plus a ring of four smoothed
+        # frames - the deque retains the last three, so the fourth is
+        # always free to be overwritten
+        self._gray_tmp = None
+        self._gray_ring = None
+        self._ring_idx = 0
         self.MIN_AREA = 30
         self.MAX_AREA = 5000
         
     def detect(self, frame):
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (5, 5), 0)
-        
+        if self._gray_ring is None:
+            h, w = frame.shape[:2]
+            self._gray_tmp = np.empty((h, w), np.uint8)
+            self._gray_ring = [np.empty((h, w), np.uint8) for _ in range(4)]
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_tmp)
+        gray = self._gray_ring[self._ring_idx]
+        self._ring_idx = (self._ring_idx + 1) % len(self._gray_ring)
+        cv2.sepFilter2D(self._gray_tmp, -1, self._gauss_k, self._gauss_k,
+                        dst=gray)
+
         self.prev_frames.append(gray)
         
         if len(self.prev_frames) < 3:
             return [], frame
         
         # Multi-frame difference (reduces stage motion artifacts)
-        diff1 = cv2.absdiff(self.prev_frames[0], self.prev_frames[1])
-        diff2 = cv2.absdiff(self.prev_frames[1], self.prev_frames[2])
-        
-        # Intersection of motion
-        motion = cv2.bitwise_and(diff1, diff2)
-        
-        _, thresh = cv2.threshold(motion, 25, 255, cv2.THRESH_BINARY)
+        if _HAVE_NUMBA:
+            # Single fused pass over the three frames into a reused mask
+            if self._motion_buf is None:
+                self._motion_buf = np.empty_like(gray)
+            _triple_diff_thresh(self.prev_frames[0], self.prev_frames[1],
+                                self.prev_frames[2], self._motion_buf, 25)
+            thresh = self._motion_buf
+        else:
+            diff1 = cv2.absdiff(self.prev_frames[0], self.prev_frames[1])
+            diff2 = cv2.absdiff(self.prev_frames[1], self.prev_frames[2])
+
+            # Intersection of motion
+            motion = cv2.min(diff1, diff2)
+
+            _, thresh = cv2.threshold(motion, 25, 255, cv2.THRESH_BINARY)
         
-        # Morphology
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-        thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=2)
+        # Morphology with the cached kernel
+        thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, self.kernel, iterations=2)
         
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -457,11 +708,14 @@ class SimpleOrganismDetector:
         return organisms, frame
     
     def run(self):
+        grabber = _LatestFrameGrabber(self.cap)
+        grabber.start()
+
         while True:
-            ret, frame = self.cap.read()
+            ret, frame = grabber.read_latest()
             if not ret:
                 break
-            
+
             organisms, display = self.detect(frame)
             
             cv2.putText(display, f"Organisms: {len(organisms)}", (10, 30),
@@ -471,7 +725,8 @@ class SimpleOrganismDetector:
             
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
-        
+
+        grabber.stop()
         self.cap.release()
         cv2.destroyAllWindows()
 
@@ -10,7 +10,10 @@ from tensorflow.keras.models import load_model
 def load_wbc_model(model_path):
     """Load trained WBC classification model and class mapping.
 
-    Returns tuple (model, classes) or raises Exception on failure.
+    Returns tuple (model, classes, needs_softmax) or raises Exception on
+    failure. needs_softmax is detected once here from the output layer's
+    activation so predict_image doesn't have to probe the probabilities
+    on every call.
     """
     if not os.path.exists(model_path):
         raise FileNotFoundError(f"Model not found: {model_path}")
@@ -26,14 +29,41 @@ def load_wbc_model(model_path):
     else:
         classes = None
 
-    return model, classes
+    try:
+        activation = getattr(model.layers[-1].activation, '__name__', '')
+        needs_softmax = activation != 'softmax'
+    except (AttributeError, IndexError):
+        needs_softmax = True
+
+    # Compiled inference path: the /255 normalization and batching live
+    # inside the graph, where XLA can fuse them into the first layer,
+    # and calls skip model.predict's per-call Python machinery
+    @tf.function(jit_compile=True)
+    def _infer(x):
+        return model(tf.cast(x, tf.float32) / 255.0)
+
+    model._infer = _infer
+
+    # Parse the expected input geometry once; predict_image reads the
+    # cached (h, w, c) tuple instead of unpacking model.input_shape and
+    # casting on every call (-1 marks a dynamic dimension)
+    try:
+        model._hwc = tuple(int(d) if d is not None else -1
+                           for d in model.input_shape[1:4])
+    except Exception:
+        model._hwc = None
 
+    return model, classes, needs_softmax
+
+
+def predict_image(model, classes, image_path, top_k=3, needs_softmax=None):
 
-def predict_image(model, classes, image_path, top_k=3):
 
-    
     """Run classification on a single image and return top_k predictions.
 
+    needs_softmax comes from load_wbc_model; when the caller doesn't
+    supply it, fall back to probing whether the outputs already sum to 1.
+
     Returns a list of (class_or_index, probability) tuples ordered by probability desc.
     """
     if not os.path.exists(image_path):
@@ -46,23 +76,28 @@ def predict_image(model, classes, image_path, top_k=3):
     # Convert to RGB
     img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
-    # Determine expected input shape from model
-    # Typical shape: (None, H, W, C)
-    input_shape = None
-    try:
-        input_shape = model.input_shape
-    except Exception:
-        # Fallback: try attribute
-        input_shape = getattr(model, 'inputs', [None])[0].shape
-
-    if input_shape is None:
-        raise RuntimeError("Unable to determine model input shape")
-
-    # Extract height, width, channels
-    _, h, w, c = input_shape
-    h = int(h) if h is not None else img.shape[0]
-    w = int(w) if w is not None else img.shape[1]
-    c = int(c) if c is not None else img.shape[2]
+    # Determine expected input shape - prefer the geometry cached by
+    # load_wbc_model, falling back to a per-call lookup for models that
+    # didn't come through it. Typical shape: (None, H, W, C)
+    hwc = getattr(model, '_hwc', None)
+    if hwc is None:
+        try:
+            input_shape = model.input_shape
+        except Exception:
+            # Fallback: try attribute
+            input_shape = getattr(model, 'inputs', [None])[0].shape
+
+        if input_shape is None:
+            raise RuntimeError("Unable to determine model input shape")
+
+        hwc = tuple(int(d) if d is not None else -1
+                    for d in input_shape[1:4])
+
+    # Dynamic dimensions (-1) fall back to the image's own geometry
+    h, w, c = hwc
+    h = h if h > 0 else img.shape[0]
+    w = w if w > 0 else img.shape[1]
+    c = c if c > 0 else img.shape[2]
 
     # Resize
     resized = cv2.resize(img, (w, h))
@@ -71,25 +106,39 @@ def predict_image(model, classes, image_path, top_k=3):
         resized = cv2.cvtColor(resized, cv2.COLOR_RGB2GRAY)
         resized = resized[..., np.newaxis]
 
-    # Scale to [0,1]
-    array = resized.astype(np.float32) / 255.0
-    batch = np.expand_dims(array, axis=0)
+    # Prefer the compiled inference path from load_wbc_model, which
+    # takes the raw uint8 batch and scales inside the graph; models
+    # loaded elsewhere fall back to NumPy preprocessing + predict
+    infer = getattr(model, '_infer', None)
+    if infer is not None:
+        preds = infer(tf.convert_to_tensor(resized[None, ...])).numpy()
+    else:
+        # Scale to [0,1]
+        array = resized.astype(np.float32) / 255.0
+        batch = np.expand_dims(array, axis=0)
 
-    preds = model.predict(batch)
-    preds = np.asarray(preds).squeeze()
+        preds = model.predict(batch)
+    preds = np.ascontiguousarray(np.asarray(preds).squeeze(),
+                                 dtype=np.float32)
 
-    # If preds are not probabilities, apply softmax
     if preds.ndim == 0:
         preds = np.array([preds])
 
     probs = preds
-    if probs.sum() <= 0 or not np.isclose(probs.sum(), 1.0):
+    if needs_softmax is None:
+        # No flag from load time - probe the outputs
+        total = probs.sum()
+        needs_softmax = total <= 0 or not np.isclose(total, 1.0)
+    if needs_softmax:
         # numerically stable softmax
         ex = np.exp(probs - np.max(probs))
         probs = ex / ex.sum()
 
-    # Get top_k indices
-    idxs = np.argsort(probs)[::-1][:top_k]
+    # Get top_k indices: O(C) partition to select the candidates, then
+    # sort only those k instead of the whole class axis
+    k = min(top_k, probs.shape[0])
+    top_idx = np.argpartition(-probs, k - 1)[:k]
+    idxs = top_idx[np.argsort(-probs[top_idx])]
     results = []
     for i in idxs:
         label = classes[i] if classes and i < len(classes) else i
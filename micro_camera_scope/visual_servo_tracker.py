@@ -7,12 +7,93 @@ to implement automatic stage movement that keeps tracked organisms centered
 in the camera frame.
 """
 
+import math
+
 import cv2
 import numpy as np
-from collections import deque
 import time
 import threading
-from queue import Queue, Empty
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the decorated function runs as plain Python; the
+    # loop stays correct, just slower
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _filter_and_argmin(centroids, tx, ty, r2):
+    """Nearest centroid to (tx, ty) within squared radius r2.
+
+    One typed loop over the (N, 2) float32 array - no intermediate
+    difference/square/sum temporaries like the NumPy expression, and
+    LLVM autovectorizes it. Returns (index, squared_distance), or
+    (-1, inf) when nothing lies within the radius.
+    """
+    best_idx = -1
+    best_d2 = np.inf
+    for i in range(centroids.shape[0]):
+        dx = centroids[i, 0] - tx
+        dy = centroids[i, 1] - ty
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2 = d2
+            best_idx = i
+    if best_d2 > r2:
+        return -1, best_d2
+    return best_idx, best_d2
+
+
+@njit(cache=True)
+def _servo_steps(cx, cy, center_x, center_y, deadzone, ppsx, ppsy, max_steps):
+    """Pixel error and clamped motor steps as typed scalar math.
+
+    The whole deadzone/scale/clamp chain compiles to a handful of
+    machine instructions instead of a dozen attribute loads and
+    PyObject unboxings per motor tick.
+    Returns (error_x, error_y, steps_x, steps_y).
+    """
+    error_x = cx - center_x
+    error_y = cy - center_y
+
+    if abs(error_x) < deadzone:
+        error_x = 0
+    if abs(error_y) < deadzone:
+        error_y = 0
+
+    steps_x = int(error_x / ppsx)
+    steps_y = int(error_y / ppsy)
+
+    if steps_x > max_steps:
+        steps_x = max_steps
+    elif steps_x < -max_steps:
+        steps_x = -max_steps
+    if steps_y > max_steps:
+        steps_y = max_steps
+    elif steps_y < -max_steps:
+        steps_y = -max_steps
+
+    return error_x, error_y, steps_x, steps_y
+
+
+def _contour_centroids(contours):
+    """Vertex-mean centroids for all contours as one (N, 2) float32 array.
+
+    cv2.moments computes full second-order moments per contour just to
+    get a center point; the mean of the polygon vertices is within a
+    pixel for the blob sizes tracked here and lets the per-frame
+    filter + nearest-search run as vectorized NumPy instead of a Python
+    loop over moments.
+    """
+    centroids = np.empty((len(contours), 2), dtype=np.float32)
+    for i, cnt in enumerate(contours):
+        centroids[i] = cnt.reshape(-1, 2).mean(axis=0)
+    return centroids
+
 
 class VisualServoTracker:
     """
@@ -24,7 +105,16 @@ class VisualServoTracker:
     - Configurable deadzone, rate limiting, and safety checks
     - Toggle-able auto-tracking mode
     """
-    
+
+    # Step-sign to command-character lookup, keyed by
+    # (sign(steps_y), sign(steps_x)) - built once at class level so
+    # send_motor_command indexes it instead of walking an if/elif chain
+    _CMDS = {
+        (0, 0): ('S', 'S'), (0, 1): ('S', 'R'), (0, -1): ('S', 'L'),
+        (1, 0): ('U', 'S'), (1, 1): ('U', 'R'), (1, -1): ('U', 'L'),
+        (-1, 0): ('D', 'S'), (-1, 1): ('D', 'R'), (-1, -1): ('D', 'L'),
+    }
+
     def __init__(self, motor_controller=None):
         """
         Initialize the visual servo tracker.
@@ -60,7 +150,13 @@ class VisualServoTracker:
         # ============================================================
         self.tracking_active = False
         self.target_position = None  # (x, y) of tracked organism
-        self.target_history = deque(maxlen=50)  # Trail of positions
+        # Trail of positions as a preallocated int32 ring buffer - one
+        # indexed store per append, and polylines draws from a view
+        # instead of rebuilding an array from 50 Python tuples per frame
+        self.TRAIL_LENGTH = 50
+        self._trail_xy = np.empty((self.TRAIL_LENGTH, 2), dtype=np.int32)
+        self._trail_head = 0
+        self._trail_len = 0
         self.selected_contour = None
         
         # Mouse interaction
@@ -72,25 +168,64 @@ class VisualServoTracker:
         self.MIN_CONTOUR_AREA = 50
         self.MAX_CONTOUR_AREA = 3000
         self.SEARCH_RADIUS = 150
+        # Squared thresholds - the tracking path compares squared
+        # distances so no sqrt runs in the per-frame loop
+        self._MAX_JUMP_SQ = self.MAX_JUMP_DISTANCE ** 2
+        self._SEARCH_RADIUS_SQ = self.SEARCH_RADIUS ** 2
+        self._CLICK_TOL_SQ = 100 ** 2
+
+        # Centroids of the current frame's contours, computed once per
+        # frame in update_tracking / handle_click_selection and reused
+        # by the drawing helpers
+        self._frame_centroids = None
         
         # Visualization
         self.show_all_contours = False
         self.show_search_radius = True
         self.show_center_crosshair = True
         self.trail_color = (255, 0, 255)  # Magenta trail
+
+        # Pre-rendered HUD sprites: the search-radius ring has fixed
+        # geometry, so rasterize it once and blit per frame instead of
+        # re-drawing the circle. The crosshair sprite is built in
+        # set_frame_dimensions once the center is known.
+        r = self.SEARCH_RADIUS
+        side = 2 * r + 3
+        self._radius_sprite = np.zeros((side, side, 3), np.uint8)
+        cv2.circle(self._radius_sprite, (r + 1, r + 1), r, (255, 255, 0), 1)
+        self._radius_alpha = self._radius_sprite.any(axis=2, keepdims=True)
+        self._cross_sprite = None
+        self._cross_alpha = None
+
+        # T-API offload for the debug contour overlay: with OpenCL
+        # available, large contour batches rasterize on the iGPU via
+        # UMat while the CPU keeps doing tracking math
+        self.use_opencl = cv2.ocl.haveOpenCL()
+        self.OPENCL_MIN_CONTOURS = 16
         
         # ============================================================
         # MOTOR CONTROL STATE
         # ============================================================
         self.last_command_time = 0
-        self.motor_command_queue = Queue(maxsize=10)
+        # Condition signaled whenever update_tracking publishes a new
+        # centroid, so the motor loop reacts immediately instead of
+        # discovering it on the next fixed-interval poll
+        self._new_target_cv = threading.Condition()
         self.motor_thread = None
         self.motor_thread_active = False
         
         # Statistics
         self.frame_count = 0
         self.commands_sent = 0
-        self.tracking_errors = []  # Store recent tracking errors for analysis
+        # Per-command stdout logging off by default - the print ran
+        # synchronously on the motor thread right after the serial write
+        self.debug_motor = False
+        # Recent tracking errors in a fixed ring buffer (power-of-two
+        # length so the head wraps with a mask) - the old list's pop(0)
+        # shifted a hundred entries on every servo iteration
+        self._err_buf = np.empty((128, 2), dtype=np.int32)
+        self._err_head = 0
+        self._err_count = 0
         
         print("Visual Servo Tracker Initialized")
         print("Features: Click-to-track + Auto-centering motor control")
@@ -104,6 +239,18 @@ class VisualServoTracker:
         self.frame_height = height
         self.CENTER_X = width // 2
         self.CENTER_Y = height // 2
+
+        # Rasterize the center crosshair once (see __init__)
+        s = 41
+        c = s // 2
+        self._cross_sprite = np.zeros((s, s, 3), np.uint8)
+        cv2.line(self._cross_sprite, (c - 20, c), (c + 20, c),
+                 (0, 255, 255), 2)
+        cv2.line(self._cross_sprite, (c, c - 20), (c, c + 20),
+                 (0, 255, 255), 2)
+        cv2.circle(self._cross_sprite, (c, c), 5, (0, 255, 255), -1)
+        self._cross_alpha = self._cross_sprite.any(axis=2, keepdims=True)
+
         print(f"Frame center set to ({self.CENTER_X}, {self.CENTER_Y})")
     
     def set_motor_controller(self, motor_controller):
@@ -135,48 +282,58 @@ class VisualServoTracker:
     def stop_motor_thread(self):
         """Stop the motor control thread."""
         self.motor_thread_active = False
+        # Wake the loop so it notices the flag without sleeping out a
+        # wait - with the condvar loop the thread exits within a
+        # scheduling quantum, so a short join bound suffices
+        with self._new_target_cv:
+            self._new_target_cv.notify_all()
         if self.motor_thread:
-            self.motor_thread.join(timeout=1.0)
+            self.motor_thread.join(timeout=0.2)
     
+    def _servo_math(self, cx, cy):
+        """Pure error/step computation via the jitted kernel.
+
+        Pure - no state is touched, so display code can call it freely.
+        Returns (error_x, error_y, steps_x, steps_y).
+        """
+        return _servo_steps(cx, cy, self.CENTER_X, self.CENTER_Y,
+                            self.DEADZONE_PIXELS,
+                            self.PIXELS_PER_STEP_X, self.PIXELS_PER_STEP_Y,
+                            self.MAX_STEPS_PER_COMMAND)
+
     def compute_motor_steps(self, cx, cy):
         """
-        Convert pixel error to motor steps with safety checks.
-        
+        Convert pixel error to motor steps with safety checks, recording
+        the error sample for analysis. Only the motor loop should call
+        this; display code uses the pure _servo_math so drawing never
+        pollutes the error history.
+
         Args:
             cx, cy: Current organism position in pixels
-            
+
         Returns:
             (steps_x, steps_y): Motor steps needed to center organism
                                Returns (0, 0) if within deadzone or invalid
         """
         if self.CENTER_X is None or self.CENTER_Y is None:
             return 0, 0
-        
-        # Compute pixel error (organism position relative to frame center)
-        error_x = cx - self.CENTER_X
-        error_y = cy - self.CENTER_Y
-        
-        # Apply deadzone - don't move if error is small
-        if abs(error_x) < self.DEADZONE_PIXELS:
-            error_x = 0
-        if abs(error_y) < self.DEADZONE_PIXELS:
-            error_y = 0
-        
-        # Convert pixel error to motor steps
-        steps_x = int(error_x / self.PIXELS_PER_STEP_X)
-        steps_y = int(error_y / self.PIXELS_PER_STEP_Y)
-        
-        # Clamp to maximum steps per command (safety)
-        steps_x = max(-self.MAX_STEPS_PER_COMMAND, min(steps_x, self.MAX_STEPS_PER_COMMAND))
-        steps_y = max(-self.MAX_STEPS_PER_COMMAND, min(steps_y, self.MAX_STEPS_PER_COMMAND))
-        
-        # Store error for analysis
-        if len(self.tracking_errors) > 100:
-            self.tracking_errors.pop(0)
-        self.tracking_errors.append((error_x, error_y))
-        
+
+        error_x, error_y, steps_x, steps_y = self._servo_math(cx, cy)
+
+        # Store error for analysis - one indexed store into the ring
+        self._err_buf[self._err_head] = (error_x, error_y)
+        self._err_head = (self._err_head + 1) & (len(self._err_buf) - 1)
+        if self._err_count < len(self._err_buf):
+            self._err_count += 1
+
         return steps_x, steps_y
     
+    def get_recent_errors(self):
+        """Recorded (error_x, error_y) samples oldest-first as (n, 2) int32."""
+        if self._err_count < len(self._err_buf):
+            return self._err_buf[:self._err_count]
+        return np.roll(self._err_buf, -self._err_head, axis=0)
+
     def send_motor_command(self, steps_x, steps_y):
         """
         Send relative motor command to Arduino.
@@ -193,32 +350,22 @@ class VisualServoTracker:
         if current_time - self.last_command_time < self.MIN_COMMAND_INTERVAL:
             return False
         
-        # Convert steps to Arduino command format
+        # Convert steps to Arduino command format via the sign lookup
         # Note: You may need to adjust the sign conventions based on your setup
-        y_cmd = 'S'  # Default to stop
-        x_cmd = 'S'  # Default to stop
-        
-        # Y-axis movement (vertical)
-        if steps_y > 0:
-            y_cmd = 'U'  # Move up
-        elif steps_y < 0:
-            y_cmd = 'D'  # Move down
-        
-        # X-axis movement (horizontal)  
-        if steps_x > 0:
-            x_cmd = 'R'  # Move right
-        elif steps_x < 0:
-            x_cmd = 'L'  # Move left
-        
+        y_cmd, x_cmd = self._CMDS[((steps_y > 0) - (steps_y < 0),
+                                   (steps_x > 0) - (steps_x < 0))]
+
         # Send command if there's movement needed
         if y_cmd != 'S' or x_cmd != 'S':
             success = self.motor_controller.send_step(y_cmd, x_cmd)
             if success:
                 self.last_command_time = current_time
                 self.commands_sent += 1
-                print(f"Motor command: {y_cmd}{x_cmd} (steps: {steps_x}, {steps_y})")
+                if self.debug_motor:
+                    print(f"Motor command: {y_cmd}{x_cmd} "
+                          f"(steps: {steps_x}, {steps_y})")
             return success
-        
+
         return True  # No movement needed is considered success
     
     def _motor_control_loop(self):
@@ -229,27 +376,59 @@ class VisualServoTracker:
         while self.motor_thread_active:
             try:
                 # Check if we have a valid tracking target
-                if (self.tracking_active and 
-                    self.target_position is not None and 
+                if (self.tracking_active and
+                    self.target_position is not None and
                     self.auto_tracking_enabled):
-                    
+
                     cx, cy = self.target_position
                     steps_x, steps_y = self.compute_motor_steps(cx, cy)
-                    
+
                     # Send motor command if movement is needed
                     if steps_x != 0 or steps_y != 0:
                         self.send_motor_command(steps_x, steps_y)
-                
-                time.sleep(0.1)  # 10 Hz control loop
-                
+
+                # Block until update_tracking signals a fresh centroid
+                # (or stop_motor_thread wakes us), bounded by the
+                # rate-limit window so a pending correction still goes
+                # out as soon as the limiter allows
+                with self._new_target_cv:
+                    remaining = (self.MIN_COMMAND_INTERVAL -
+                                 (time.time() - self.last_command_time))
+                    self._new_target_cv.wait(
+                        timeout=remaining if remaining > 0 else 0.1)
+
             except Exception as e:
                 print(f"Motor control loop error: {e}")
-                time.sleep(0.5)
+                # Back off on the condvar so shutdown can interrupt it
+                with self._new_target_cv:
+                    if self.motor_thread_active:
+                        self._new_target_cv.wait(timeout=0.5)
     
     # ============================================================
     # TRACKING METHODS (from InteractiveOrganismTracker)
     # ============================================================
     
+    def _push_trail(self, cx, cy):
+        """Append a position to the trail ring buffer."""
+        self._trail_xy[self._trail_head] = (cx, cy)
+        self._trail_head = (self._trail_head + 1) % self.TRAIL_LENGTH
+        if self._trail_len < self.TRAIL_LENGTH:
+            self._trail_len += 1
+
+    def _trail_view(self):
+        """Trail positions oldest-first as an (n, 2) int32 array.
+
+        A zero-copy slice until the ring wraps; after that np.roll pays
+        one small copy per drawn frame.
+        """
+        if self._trail_len < self.TRAIL_LENGTH:
+            return self._trail_xy[:self._trail_len]
+        return np.roll(self._trail_xy, -self._trail_head, axis=0)
+
+    def _clear_trail(self):
+        self._trail_head = 0
+        self._trail_len = 0
+
     def mouse_callback(self, event, x, y, flags, param):
         """Handle mouse clicks to select organism."""
         if event == cv2.EVENT_LBUTTONDOWN:
@@ -258,115 +437,112 @@ class VisualServoTracker:
             print(f"\n[CLICK] Position: ({x}, {y})")
             print("Searching for nearest contour...")
     
-    def find_nearest_contour(self, contours, target_point):
-        """Find contour whose centroid is closest to target point."""
+    def find_nearest_contour(self, contours, target_point, centroids=None):
+        """Find contour whose centroid is closest to target point.
+
+        Returns (contour, squared_distance, centroid). Distances stay
+        squared so callers compare against squared thresholds; take
+        sqrt only for display.
+        """
         if not contours:
             return None, float('inf'), None
-        
-        min_distance = float('inf')
-        nearest_contour = None
-        nearest_centroid = None
-        
-        for cnt in contours:
-            M = cv2.moments(cnt)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            distance = np.sqrt((cx - target_point[0])**2 + (cy - target_point[1])**2)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_contour = cnt
-                nearest_centroid = (cx, cy)
-        
-        return nearest_contour, min_distance, nearest_centroid
-    
-    def filter_contours_near_target(self, contours, target_position):
-        """Filter contours to only those within search radius of target."""
-        if target_position is None:
-            return contours
-        
-        filtered = []
-        for cnt in contours:
-            M = cv2.moments(cnt)
-            if M["m00"] == 0:
-                continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            distance = np.sqrt(
-                (cx - target_position[0])**2 + 
-                (cy - target_position[1])**2
-            )
-            
-            if distance <= self.SEARCH_RADIUS:
-                filtered.append(cnt)
-        
-        return filtered
-    
+
+        if centroids is None:
+            centroids = _contour_centroids(contours)
+
+        d2 = ((centroids - np.float32(target_point)) ** 2).sum(axis=1)
+        idx = int(np.argmin(d2))
+        cx, cy = centroids[idx]
+
+        return contours[idx], float(d2[idx]), (int(cx), int(cy))
+
     def update_tracking(self, contours):
         """
         Update tracking by finding nearest contour to last known position.
         This is the main tracking update method called each frame.
         """
+        # Centroids computed once per frame; drawing helpers reuse them
+        self._frame_centroids = _contour_centroids(contours) if contours else None
+
         if not self.tracking_active or self.target_position is None:
             return None
-        
-        # Filter to contours near last known position
-        nearby_contours = self.filter_contours_near_target(contours, self.target_position)
-        
-        if not nearby_contours:
+
+        if not contours:
             return None
-        
-        # Find nearest contour to last position
-        nearest_cnt, distance, centroid = self.find_nearest_contour(
-            nearby_contours, 
-            self.target_position
-        )
-        
-        if nearest_cnt is None:
+
+        # Single fused pass replaces the old filter-then-search double
+        # loop: nearest candidate by squared distance, radius check
+        # applied to the winner, all inside one jitted loop
+        tx, ty = self.target_position
+        idx, distance_sq = _filter_and_argmin(
+            self._frame_centroids, float(tx), float(ty),
+            float(self._SEARCH_RADIUS_SQ))
+
+        if idx < 0:
             return None
-        
+
         # Check if jump is reasonable
-        if distance > self.MAX_JUMP_DISTANCE:
-            print(f"[WARNING] Large jump detected: {distance:.1f}px - possible tracking loss")
-        
+        if distance_sq > self._MAX_JUMP_SQ:
+            print(f"[WARNING] Large jump detected: "
+                  f"{math.sqrt(distance_sq):.1f}px - possible tracking loss")
+
         # Update tracking state
+        cx, cy = self._frame_centroids[idx]
+        centroid = (int(cx), int(cy))
+        nearest_cnt = contours[idx]
         self.target_position = centroid
-        self.target_history.append(centroid)
+        self._push_trail(*centroid)
         self.selected_contour = nearest_cnt
-        
+
+        # Wake the motor loop for the fresh centroid rather than letting
+        # it wait out its current sleep
+        if self.auto_tracking_enabled:
+            with self._new_target_cv:
+                self._new_target_cv.notify()
+
         return nearest_cnt
     
     def handle_click_selection(self, contours):
         """Handle mouse click selection of organism."""
         if self.awaiting_selection and self.click_position:
-            nearest_cnt, distance, centroid = self.find_nearest_contour(
-                contours, 
-                self.click_position
-            )
-            
-            if nearest_cnt is not None and distance < 100:
+            # Reuse this frame's centroids when they match the contour
+            # list; if they don't, recompute once and re-cache so any
+            # later helper this frame gets the fresh array too
+            centroids = self._frame_centroids
+            if centroids is None or len(centroids) != len(contours):
+                centroids = _contour_centroids(contours)
+                self._frame_centroids = centroids
+
+            # Same fused search-and-gate kernel as update_tracking: the
+            # 100px click tolerance is applied inside the single pass
+            # instead of argmin-then-compare over all contours
+            idx, distance_sq = _filter_and_argmin(
+                centroids,
+                float(self.click_position[0]),
+                float(self.click_position[1]),
+                float(self._CLICK_TOL_SQ))
+
+            if idx >= 0:
+                ccx, ccy = centroids[idx]
+                centroid = (int(ccx), int(ccy))
+                nearest_cnt = contours[idx]
                 # Start tracking this organism
                 self.tracking_active = True
                 self.target_position = centroid
                 self.selected_contour = nearest_cnt
-                self.target_history.clear()
-                self.target_history.append(centroid)
+                self._clear_trail()
+                self._push_trail(*centroid)
                 
                 print(f"[LOCKED] Organism at ({centroid[0]}, {centroid[1]})")
-                print(f"         Distance from click: {distance:.1f}px")
+                print(f"         Distance from click: {math.sqrt(distance_sq):.1f}px")
                 print(f"         Contour area: {cv2.contourArea(nearest_cnt):.0f}px²")
                 
                 if self.auto_tracking_enabled:
                     print("         Auto-tracking will keep organism centered")
             else:
                 print(f"[FAILED] No contour found near click position")
-                print(f"         Nearest contour: {distance:.1f}px away")
+                if distance_sq != float('inf'):
+                    print(f"         Nearest contour: {math.sqrt(distance_sq):.1f}px away")
             
             self.awaiting_selection = False
             self.click_position = None
@@ -376,23 +552,36 @@ class VisualServoTracker:
         print("\n[RESET] Tracking cleared - click to select new organism")
         self.tracking_active = False
         self.target_position = None
-        self.target_history.clear()
+        self._clear_trail()
         self.selected_contour = None
-        self.tracking_errors.clear()
+        self._err_head = 0
+        self._err_count = 0
     
     # ============================================================
     # VISUALIZATION METHODS
     # ============================================================
     
+    def _blit_sprite(self, frame, sprite, alpha, cx, cy):
+        """Copy a pre-rendered sprite centered at (cx, cy), clipped to frame."""
+        sh, sw = sprite.shape[:2]
+        x0 = cx - sw // 2
+        y0 = cy - sh // 2
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1 = min(x0 + sw, frame.shape[1])
+        fy1 = min(y0 + sh, frame.shape[0])
+        if fx0 >= fx1 or fy0 >= fy1:
+            return
+        sy = slice(fy0 - y0, fy1 - y0)
+        sx = slice(fx0 - x0, fx1 - x0)
+        np.copyto(frame[fy0:fy1, fx0:fx1], sprite[sy, sx],
+                  where=alpha[sy, sx])
+
     def draw_tracking_info(self, frame):
         """Draw all tracking and motor control visualizations."""
-        # Draw frame center crosshair
-        if self.show_center_crosshair and self.CENTER_X is not None:
-            cv2.line(frame, (self.CENTER_X - 20, self.CENTER_Y), 
-                    (self.CENTER_X + 20, self.CENTER_Y), (0, 255, 255), 2)
-            cv2.line(frame, (self.CENTER_X, self.CENTER_Y - 20), 
-                    (self.CENTER_X, self.CENTER_Y + 20), (0, 255, 255), 2)
-            cv2.circle(frame, (self.CENTER_X, self.CENTER_Y), 5, (0, 255, 255), -1)
+        # Blit the pre-rendered frame center crosshair
+        if self.show_center_crosshair and self._cross_sprite is not None:
+            self._blit_sprite(frame, self._cross_sprite, self._cross_alpha,
+                              self.CENTER_X, self.CENTER_Y)
         
         # Draw click position if awaiting selection
         if self.awaiting_selection and self.click_position:
@@ -406,9 +595,10 @@ class VisualServoTracker:
         if self.tracking_active and self.target_position:
             cx, cy = self.target_position
             
-            # Search radius circle
+            # Search radius ring - pre-rendered sprite, clipped blit
             if self.show_search_radius:
-                cv2.circle(frame, (cx, cy), self.SEARCH_RADIUS, (255, 255, 0), 1)
+                self._blit_sprite(frame, self._radius_sprite,
+                                  self._radius_alpha, cx, cy)
             
             # Draw tracked contour (thick green outline)
             if self.selected_contour is not None:
@@ -418,60 +608,57 @@ class VisualServoTracker:
             cv2.circle(frame, (cx, cy), 8, (0, 0, 255), -1)
             cv2.circle(frame, (cx, cy), 12, (255, 255, 255), 2)
             
-            # Coordinates and error info
+            # Coordinates and error info - one anti-aliased pass per
+            # label instead of the old shadow + foreground double draw
+            # (glyph rasterization is scalar and surprisingly expensive)
             if self.CENTER_X is not None:
+                # Pure computations only - calling compute_motor_steps
+                # here would push a duplicate sample into the error ring
                 error_x = cx - self.CENTER_X
                 error_y = cy - self.CENTER_Y
-                steps_x, steps_y = self.compute_motor_steps(cx, cy)
-                
-                cv2.putText(frame, f"TRACKING: ({cx}, {cy})", 
-                           (cx + 15, cy - 15),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                cv2.putText(frame, f"TRACKING: ({cx}, {cy})", 
+
+                cv2.putText(frame, f"TRACKING: ({cx}, {cy})",
                            (cx + 15, cy - 15),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1)
-                
-                cv2.putText(frame, f"Error: ({error_x:.0f}, {error_y:.0f})px", 
-                           (cx + 15, cy + 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-                cv2.putText(frame, f"Error: ({error_x:.0f}, {error_y:.0f})px", 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2,
+                           cv2.LINE_AA)
+
+                cv2.putText(frame, f"Error: ({error_x:.0f}, {error_y:.0f})px",
                            (cx + 15, cy + 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-                
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2,
+                           cv2.LINE_AA)
+
                 if self.auto_tracking_enabled:
-                    cv2.putText(frame, f"Steps: ({steps_x}, {steps_y})", 
+                    _, _, steps_x, steps_y = self._servo_math(cx, cy)
+                    cv2.putText(frame, f"Steps: ({steps_x}, {steps_y})",
                                (cx + 15, cy + 25),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-                    cv2.putText(frame, f"Steps: ({steps_x}, {steps_y})", 
-                               (cx + 15, cy + 25),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2,
+                               cv2.LINE_AA)
             
-            # Trail of previous positions
-            if len(self.target_history) > 1:
-                points = np.array(self.target_history, dtype=np.int32)
-                cv2.polylines(frame, [points], False, self.trail_color, 2)
-                
-                # Draw dots along trail
-                for i, point in enumerate(self.target_history):
-                    alpha = i / len(self.target_history)
-                    radius = int(3 + 2 * alpha)
-                    cv2.circle(frame, point, radius, self.trail_color, -1)
+            # Trail of previous positions - drawn straight from the ring
+            # buffer in one anti-aliased polyline. The old per-dot circle
+            # loop issued up to 50 scalar rasterization calls per frame
+            # for a trail the line already renders.
+            if self._trail_len > 1:
+                points = self._trail_view()
+                cv2.polylines(frame, [points], False, self.trail_color, 2,
+                              cv2.LINE_AA)
         
         # Status overlay
         self.draw_status_overlay(frame)
     
     def draw_status_overlay(self, frame):
         """Draw status information overlay."""
-        # Status background
-        status_bg = frame.copy()
-        cv2.rectangle(status_bg, (0, 0), (frame.shape[1], 100), (0, 0, 0), -1)
-        cv2.addWeighted(status_bg, 0.4, frame, 0.6, 0, frame)
+        # Status background: darken only the 100px banner strip in place.
+        # The old full-frame copy + rectangle + addWeighted touched every
+        # pixel of the frame just to dim this strip.
+        banner = frame[:100]
+        np.multiply(banner, 0.6, out=banner, casting='unsafe')
         
         # Main status
         if self.tracking_active:
             status = "TRACKING ACTIVE"
             color = (0, 255, 0)
-            trail_length = len(self.target_history)
+            trail_length = self._trail_len
             cv2.putText(frame, f"Trail Length: {trail_length} frames",
                        (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         else:
@@ -492,31 +679,52 @@ class VisualServoTracker:
         cv2.putText(frame, auto_status, (10, 75),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, auto_color, 2)
         
-        # Commands sent counter
+        # Commands sent counter - anchor positions come from the
+        # dimensions cached by set_frame_dimensions, not per-frame
+        # shape lookups
+        width = self.frame_width if self.frame_width else frame.shape[1]
+        height = self.frame_height if self.frame_height else frame.shape[0]
         cv2.putText(frame, f"Commands sent: {self.commands_sent}",
-                   (frame.shape[1] - 200, 30),
+                   (width - 200, 30),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
+
         # Controls
         cv2.putText(frame, "Controls: CLICK=Select | T=Toggle Auto | R=Reset | Q=Quit",
-                   (10, frame.shape[0] - 10),
+                   (10, height - 10),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
     
-    def draw_all_contours(self, frame, contours):
-        """Draw all detected contours in debug mode."""
+    def draw_all_contours(self, frame, contours, centroids=None):
+        """Draw all detected contours in debug mode.
+
+        Reuses the centroids computed in update_tracking when available
+        instead of rerunning cv2.moments per contour.
+        """
         if not self.show_all_contours:
             return
-        
-        for cnt in contours:
-            area = cv2.contourArea(cnt)
-            if self.MIN_CONTOUR_AREA < area < self.MAX_CONTOUR_AREA:
-                M = cv2.moments(cnt)
-                if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    
-                    cv2.drawContours(frame, [cnt], -1, (255, 200, 100), 1)
-                    cv2.circle(frame, (cx, cy), 3, (255, 200, 100), -1)
+
+        if centroids is None:
+            centroids = self._frame_centroids
+        if centroids is None or len(centroids) != len(contours):
+            centroids = _contour_centroids(contours)
+
+        # Area-filter first into one array, then draw only the survivors
+        areas = np.fromiter((cv2.contourArea(c) for c in contours),
+                            dtype=np.float32, count=len(contours))
+        keep = np.flatnonzero((areas > self.MIN_CONTOUR_AREA) &
+                              (areas < self.MAX_CONTOUR_AREA))
+
+        survivors = [contours[i] for i in keep]
+        if self.use_opencl and len(survivors) >= self.OPENCL_MIN_CONTOURS:
+            # Batch is big enough that GPU rasterization beats the
+            # UMat round-trip cost; small lists stay on the CPU
+            uframe = cv2.UMat(frame)
+            cv2.drawContours(uframe, survivors, -1, (255, 200, 100), 1)
+            np.copyto(frame, uframe.get())
+        else:
+            cv2.drawContours(frame, survivors, -1, (255, 200, 100), 1)
+        for i in keep:
+            cx, cy = centroids[i]
+            cv2.circle(frame, (int(cx), int(cy)), 3, (255, 200, 100), -1)
     
     def cleanup(self):
         """Clean up resources."""
@@ -27,7 +27,16 @@ import os
 # Add the micro_camera_scope directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'micro_camera_scope'))
 
-from Arrows_Key import MicroscopeStitcher
+
+def __getattr__(name):
+    # PEP 562 lazy import: pulling in the stitcher loads OpenCV, Tk,
+    # PIL, and pyserial - hundreds of ms of dynamic-loader work that
+    # shouldn't run until the app is actually being started
+    if name == "MicroscopeStitcher":
+        from Arrows_Key import MicroscopeStitcher
+        return MicroscopeStitcher
+    raise AttributeError(name)
+
 
 def main():
     print("="*70)
@@ -49,6 +58,10 @@ def main():
     print("\nThe stage will automatically move to keep the tracked organism centered!")
     print("="*70)
     
+    # Heavy import deferred until after the banner so startup feedback
+    # is instant
+    from Arrows_Key import MicroscopeStitcher
+
     # Create and run the application
     app = MicroscopeStitcher()
     